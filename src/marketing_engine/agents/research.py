@@ -64,14 +64,14 @@ class ResearchAgent(BaseAgent):
             platforms = []
             for p in item.get("platforms", ["twitter"]):
                 p_lower = p.lower().strip()
-                if p_lower in Platform.__members__:
+                if Platform.has_value(p_lower):
                     platforms.append(Platform(p_lower))
             if not platforms:
                 platforms = [Platform.twitter]
 
             # Normalize stream value
             stream_val = item.get("stream", "project_marketing").lower().strip()
-            if stream_val not in ContentStream.__members__:
+            if not ContentStream.has_value(stream_val):
                 stream_val = "project_marketing"
 
             brief = ContentBrief(
@@ -391,7 +391,7 @@ def export_cmd(
         result = export_approved(db, week_of, fmt=fmt)
 
         if output:
-            Path(output).write_text(result)
+            Path(output).write_text(result, encoding="utf-8")
             console.print(f"[green]Exported to {output}[/green]")
         else:
             console.print(result)
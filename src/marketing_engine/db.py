@@ -6,8 +6,11 @@ import functools
 import json
 import sqlite3
 import threading
-from datetime import UTC, date, datetime
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
+from uuid import uuid4
 
 from marketing_engine.enums import ApprovalStatus, ContentStream, Platform, PublishStatus
 from marketing_engine.exceptions import DatabaseError
@@ -68,20 +71,129 @@ CREATE TABLE IF NOT EXISTS publish_log (
     platform_post_id TEXT,
     post_url TEXT,
     error TEXT,
-    published_at TEXT
+    published_at TEXT,
+    published_at_epoch INTEGER
 );
 CREATE INDEX IF NOT EXISTS idx_publish_log_post ON publish_log(post_id);
 """
 
+# Runs after column migrations so the indexed columns exist on older databases.
+_POST_MIGRATION = """
+CREATE INDEX IF NOT EXISTS idx_publish_log_published_at_epoch
+    ON publish_log(published_at_epoch DESC);
+"""
+
 _MIGRATION_COLUMNS = [
     ("post_drafts", "publish_status", "TEXT NOT NULL DEFAULT 'pending'"),
     ("post_drafts", "published_at", "TEXT"),
     ("post_drafts", "post_url", "TEXT"),
     ("post_drafts", "platform_post_id", "TEXT"),
     ("post_drafts", "publish_error", "TEXT"),
+    ("publish_log", "published_at_epoch", "INTEGER"),
 ]
 
 
+def _from_iso(value: str | None) -> datetime | None:
+    """Parse a nullable ISO-8601 column value with the C ``fromisoformat`` parser."""
+    return datetime.fromisoformat(value) if value else None
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_US = timedelta(microseconds=1)
+
+
+def _to_epoch_us(value: datetime | None) -> int | None:
+    """Convert a datetime to integer microseconds since the Unix epoch.
+
+    Naive values are taken as UTC, matching how SQLite reads an ISO string
+    without an offset. Uses exact integer arithmetic rather than the float
+    ``timestamp()``.
+    """
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return (value - _EPOCH) // _ONE_US
+
+
+_INSERT_DRAFT_SQL = """INSERT INTO post_drafts
+   (id, brief_id, pipeline_run_id, stream, platform, content,
+    media_urls, cta_url, hashtags, subreddit, scheduled_time,
+    approval_status, edited_content, rejection_reason,
+    publish_status, published_at, post_url, platform_post_id,
+    publish_error, created_at, updated_at)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _draft_params(draft: PostDraft, pipeline_run_id: str) -> tuple:
+    """Build the positional parameters for ``_INSERT_DRAFT_SQL``."""
+    return (
+        draft.id,
+        draft.brief_id,
+        pipeline_run_id,
+        draft.stream.value,
+        draft.platform.value,
+        draft.content,
+        json.dumps(draft.media_urls),
+        draft.cta_url,
+        json.dumps(draft.hashtags),
+        draft.subreddit,
+        draft.scheduled_time.isoformat() if draft.scheduled_time else None,
+        draft.approval_status.value,
+        draft.edited_content,
+        draft.rejection_reason,
+        draft.publish_status.value,
+        draft.published_at.isoformat() if draft.published_at else None,
+        draft.post_url,
+        draft.platform_post_id,
+        draft.publish_error,
+        draft.created_at.isoformat(),
+        draft.updated_at.isoformat(),
+    )
+
+
+# Publish-path statements run on every scheduler tick; keeping them as module
+# constants (and the statement cache roomy) means they are prepared only once
+# per connection.
+_STATEMENT_CACHE_SIZE = 256
+
+# Rows decoded per fetchmany() call when streaming query results.
+_FETCH_BATCH_SIZE = 100
+
+_SELECT_PUBLISHABLE_SQL = """SELECT * FROM post_drafts
+   WHERE approval_status IN ('approved', 'edited')
+     AND publish_status = 'pending'
+     AND scheduled_time <= ?
+   ORDER BY scheduled_time"""
+
+_UPDATE_PUBLISH_STATUS_SQL = """UPDATE post_drafts
+   SET publish_status = ?, published_at = ?, post_url = ?,
+       platform_post_id = ?, publish_error = ?, updated_at = ?
+   WHERE id = ?"""
+
+_SELECT_PUBLISH_HISTORY_SQL = "SELECT * FROM publish_log ORDER BY published_at_epoch DESC LIMIT ?"
+
+_INSERT_PUBLISH_LOG_SQL = """INSERT INTO publish_log
+   (id, post_id, platform, status, platform_post_id,
+    post_url, error, published_at, published_at_epoch)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _publish_log_params(result: PublishResult) -> tuple:
+    """Build the positional parameters for ``_INSERT_PUBLISH_LOG_SQL``."""
+    return (
+        str(uuid4()),
+        result.post_id,
+        result.platform.value,
+        "published" if result.success else "failed",
+        result.platform_post_id,
+        result.post_url,
+        result.error,
+        result.published_at.isoformat() if result.published_at else None,
+        _to_epoch_us(result.published_at),
+    )
+
+
 class Database:
     """SQLite database wrapper with WAL mode and thread-local connections."""
 
@@ -96,13 +208,52 @@ class Database:
         """Get or create a thread-local database connection."""
         conn = getattr(self._local, "conn", None)
         if conn is None:
-            conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            # Autocommit mode: single statements commit on their own and
+            # multi-statement writes go through transaction().
+            conn = sqlite3.connect(
+                self._db_path,
+                check_same_thread=False,
+                isolation_level=None,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+            )
             conn.row_factory = sqlite3.Row
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("PRAGMA foreign_keys=ON")
             self._local.conn = conn
         return conn
 
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed statements in one ``BEGIN IMMEDIATE`` transaction.
+
+        Commits on success and rolls back on any exception. Nested use runs in
+        a savepoint inside the open transaction, so the inner block still
+        rolls back on its own while the outer one decides whether to commit.
+        """
+        conn = self._get_conn()
+        if conn.in_transaction:
+            depth = getattr(self._local, "savepoint_depth", 0) + 1
+            name = f"tx_{depth}"
+            self._local.savepoint_depth = depth
+            conn.execute(f"SAVEPOINT {name}")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute(f"ROLLBACK TO {name}")
+                conn.execute(f"RELEASE {name}")
+                raise
+            finally:
+                self._local.savepoint_depth = depth - 1
+            conn.execute(f"RELEASE {name}")
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
     def init_schema(self) -> None:
         """Create tables and indexes if they do not exist."""
         conn = self._get_conn()
@@ -111,16 +262,36 @@ class Database:
         except sqlite3.Error as exc:
             raise DatabaseError(f"Failed to initialize schema: {exc}") from exc
         self._migrate_columns(conn)
+        try:
+            self._backfill_publish_epochs(conn)
+            conn.executescript(_POST_MIGRATION)
+        except sqlite3.Error as exc:
+            raise DatabaseError(f"Failed to migrate schema: {exc}") from exc
 
     def _migrate_columns(self, conn: sqlite3.Connection) -> None:
         """Add columns that may be missing from older schemas."""
         for table, column, col_def in _MIGRATION_COLUMNS:
-            try:
+            # OperationalError means the column already exists
+            with suppress(sqlite3.OperationalError):
                 conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {col_def}")
-                conn.commit()
-            except sqlite3.OperationalError:
-                # Column already exists
-                pass
+
+    def _backfill_publish_epochs(self, conn: sqlite3.Connection) -> None:
+        """Fill ``published_at_epoch`` for publish_log rows written before the column existed.
+
+        Done in Python through ``_to_epoch_us`` so legacy rows keep their full
+        microsecond precision and sort consistently with newly written ones.
+        """
+        rows = conn.execute(
+            "SELECT id, published_at FROM publish_log "
+            "WHERE published_at_epoch IS NULL AND published_at IS NOT NULL"
+        ).fetchall()
+        if not rows:
+            return
+        with self.transaction():
+            conn.executemany(
+                "UPDATE publish_log SET published_at_epoch = ? WHERE id = ?",
+                [(_to_epoch_us(_from_iso(published_at)), id_) for id_, published_at in rows],
+            )
 
     def save_brief(self, brief: ContentBrief, pipeline_run_id: str) -> str:
         """Insert a content brief and return its ID."""
@@ -143,7 +314,6 @@ class Database:
                     brief.created_at.isoformat(),
                 ),
             )
-            conn.commit()
         except sqlite3.Error as exc:
             raise DatabaseError(f"Failed to save brief {brief.id}: {exc}") from exc
         return brief.id
@@ -152,43 +322,22 @@ class Database:
         """Insert a post draft and return its ID."""
         conn = self._get_conn()
         try:
-            conn.execute(
-                """INSERT INTO post_drafts
-                   (id, brief_id, pipeline_run_id, stream, platform, content,
-                    media_urls, cta_url, hashtags, subreddit, scheduled_time,
-                    approval_status, edited_content, rejection_reason,
-                    publish_status, published_at, post_url, platform_post_id,
-                    publish_error, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    draft.id,
-                    draft.brief_id,
-                    pipeline_run_id,
-                    draft.stream.value,
-                    draft.platform.value,
-                    draft.content,
-                    json.dumps(draft.media_urls),
-                    draft.cta_url,
-                    json.dumps(draft.hashtags),
-                    draft.subreddit,
-                    draft.scheduled_time.isoformat() if draft.scheduled_time else None,
-                    draft.approval_status.value,
-                    draft.edited_content,
-                    draft.rejection_reason,
-                    draft.publish_status.value,
-                    draft.published_at.isoformat() if draft.published_at else None,
-                    draft.post_url,
-                    draft.platform_post_id,
-                    draft.publish_error,
-                    draft.created_at.isoformat(),
-                    draft.updated_at.isoformat(),
-                ),
-            )
-            conn.commit()
+            conn.execute(_INSERT_DRAFT_SQL, _draft_params(draft, pipeline_run_id))
         except sqlite3.Error as exc:
             raise DatabaseError(f"Failed to save draft {draft.id}: {exc}") from exc
         return draft.id
 
+    def save_drafts_bulk(self, drafts: list[PostDraft], pipeline_run_id: str) -> list[str]:
+        """Insert several post drafts in a single transaction and return their IDs."""
+        try:
+            with self.transaction() as conn:
+                conn.executemany(
+                    _INSERT_DRAFT_SQL, [_draft_params(d, pipeline_run_id) for d in drafts]
+                )
+        except sqlite3.Error as exc:
+            raise DatabaseError(f"Failed to save {len(drafts)} drafts: {exc}") from exc
+        return [d.id for d in drafts]
+
     def save_pipeline_run(self, run: PipelineRun) -> str:
         """Insert a pipeline run record and return its ID."""
         conn = self._get_conn()
@@ -210,7 +359,6 @@ class Database:
                     run.error,
                 ),
             )
-            conn.commit()
         except sqlite3.Error as exc:
             raise DatabaseError(f"Failed to save pipeline run {run.id}: {exc}") from exc
         return run.id
@@ -242,13 +390,16 @@ class Database:
                 f"UPDATE pipeline_runs SET {set_clause} WHERE id = ?",  # noqa: S608
                 values,
             )
-            conn.commit()
         except sqlite3.Error as exc:
             raise DatabaseError(f"Failed to update pipeline run {run_id}: {exc}") from exc
 
     def _row_to_post(self, row: sqlite3.Row) -> PostDraft:
-        """Convert a database row to a PostDraft model."""
-        return PostDraft(
+        """Convert a database row to a PostDraft model.
+
+        Columns are decoded to their field types here, and the DB only holds
+        drafts that were validated on the way in, so validation is skipped.
+        """
+        return PostDraft.model_construct(
             id=row["id"],
             brief_id=row["brief_id"],
             stream=ContentStream(row["stream"]),
@@ -258,16 +409,12 @@ class Database:
             cta_url=row["cta_url"],
             hashtags=json.loads(row["hashtags"]),
             subreddit=row["subreddit"],
-            scheduled_time=(
-                datetime.fromisoformat(row["scheduled_time"]) if row["scheduled_time"] else None
-            ),
+            scheduled_time=_from_iso(row["scheduled_time"]),
             approval_status=ApprovalStatus(row["approval_status"]),
             edited_content=row["edited_content"],
             rejection_reason=row["rejection_reason"],
             publish_status=PublishStatus(row["publish_status"]),
-            published_at=(
-                datetime.fromisoformat(row["published_at"]) if row["published_at"] else None
-            ),
+            published_at=_from_iso(row["published_at"]),
             post_url=row["post_url"],
             platform_post_id=row["platform_post_id"],
             publish_error=row["publish_error"],
@@ -347,7 +494,6 @@ class Database:
                    WHERE id = ?""",
                 (status.value, edited_content, rejection_reason, now, post_id),
             )
-            conn.commit()
         except sqlite3.Error as exc:
             raise DatabaseError(f"Failed to update approval for {post_id}: {exc}") from exc
 
@@ -357,9 +503,7 @@ class Database:
             id=row["id"],
             week_of=date.fromisoformat(row["week_of"]),
             started_at=datetime.fromisoformat(row["started_at"]),
-            completed_at=(
-                datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None
-            ),
+            completed_at=_from_iso(row["completed_at"]),
             briefs_count=row["briefs_count"],
             drafts_count=row["drafts_count"],
             posts_count=row["posts_count"],
@@ -379,22 +523,27 @@ class Database:
             raise DatabaseError(f"Failed to get pipeline runs: {exc}") from exc
         return [self._row_to_run(r) for r in rows]
 
-    def get_publishable(self, now: datetime) -> list[PostDraft]:
-        """Return approved posts that are due for publishing."""
+    def iter_publishable(
+        self, now: datetime, batch_size: int = _FETCH_BATCH_SIZE
+    ) -> Iterator[PostDraft]:
+        """Yield approved posts that are due for publishing, ``batch_size`` rows at a time.
+
+        The query cursor stays open while the generator is being consumed. Do
+        not write to these posts (e.g. ``update_publish_status``) on the same
+        thread's connection until it is exhausted: SQLite may then skip or
+        repeat rows. Use ``get_publishable`` when the caller updates as it goes.
+        """
         conn = self._get_conn()
-        now_str = now.isoformat()
         try:
-            rows = conn.execute(
-                """SELECT * FROM post_drafts
-                   WHERE approval_status IN ('approved', 'edited')
-                     AND publish_status = 'pending'
-                     AND scheduled_time <= ?
-                   ORDER BY scheduled_time""",
-                (now_str,),
-            ).fetchall()
+            cursor = conn.execute(_SELECT_PUBLISHABLE_SQL, (now.isoformat(),))
+            while rows := cursor.fetchmany(batch_size):
+                yield from (self._row_to_post(r) for r in rows)
         except sqlite3.Error as exc:
             raise DatabaseError(f"Failed to get publishable posts: {exc}") from exc
-        return [self._row_to_post(r) for r in rows]
+
+    def get_publishable(self, now: datetime) -> list[PostDraft]:
+        """Return approved posts that are due for publishing."""
+        return list(self.iter_publishable(now))
 
     def update_publish_status(
         self,
@@ -410,10 +559,7 @@ class Database:
         now = datetime.now(UTC).isoformat()
         try:
             conn.execute(
-                """UPDATE post_drafts
-                   SET publish_status = ?, published_at = ?, post_url = ?,
-                       platform_post_id = ?, publish_error = ?, updated_at = ?
-                   WHERE id = ?""",
+                _UPDATE_PUBLISH_STATUS_SQL,
                 (
                     status.value,
                     published_at.isoformat() if published_at else None,
@@ -424,47 +570,35 @@ class Database:
                     post_id,
                 ),
             )
-            conn.commit()
         except sqlite3.Error as exc:
             raise DatabaseError(f"Failed to update publish status for {post_id}: {exc}") from exc
 
     def save_publish_log(self, result: PublishResult) -> None:
         """Insert a publish log entry."""
-        from uuid import uuid4
-
         conn = self._get_conn()
         try:
-            conn.execute(
-                """INSERT INTO publish_log
-                   (id, post_id, platform, status, platform_post_id,
-                    post_url, error, published_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    str(uuid4()),
-                    result.post_id,
-                    result.platform.value,
-                    "published" if result.success else "failed",
-                    result.platform_post_id,
-                    result.post_url,
-                    result.error,
-                    result.published_at.isoformat() if result.published_at else None,
-                ),
-            )
-            conn.commit()
+            conn.execute(_INSERT_PUBLISH_LOG_SQL, _publish_log_params(result))
         except sqlite3.Error as exc:
             raise DatabaseError(f"Failed to save publish log: {exc}") from exc
 
+    def save_publish_logs_bulk(self, results: list[PublishResult]) -> None:
+        """Insert several publish log entries in a single transaction."""
+        try:
+            with self.transaction() as conn:
+                conn.executemany(_INSERT_PUBLISH_LOG_SQL, [_publish_log_params(r) for r in results])
+        except sqlite3.Error as exc:
+            raise DatabaseError(f"Failed to save {len(results)} publish logs: {exc}") from exc
+
     def get_publish_history(self, limit: int = 20) -> list[dict]:
         """Return recent publish log entries."""
         conn = self._get_conn()
         try:
-            rows = conn.execute(
-                "SELECT * FROM publish_log ORDER BY published_at DESC LIMIT ?",
-                (limit,),
-            ).fetchall()
+            cursor = conn.execute(_SELECT_PUBLISH_HISTORY_SQL, (limit,))
+            # Materialize straight from the cursor; no intermediate list of Rows.
+            entries = list(map(dict, cursor))
         except sqlite3.Error as exc:
             raise DatabaseError(f"Failed to get publish history: {exc}") from exc
-        return [dict(r) for r in rows]
+        return entries
 
     def close(self) -> None:
         """Close the thread-local database connection."""
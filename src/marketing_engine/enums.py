@@ -3,7 +3,16 @@
 from enum import StrEnum
 
 
-class Platform(StrEnum):
+class _LookupStrEnum(StrEnum):
+    """StrEnum base with a constant-time check for raw string values."""
+
+    @classmethod
+    def has_value(cls, value: str) -> bool:
+        """Return True if ``value`` is the value of one of the members."""
+        return value in cls._value2member_map_
+
+
+class Platform(_LookupStrEnum):
     """Supported social media platforms."""
 
     twitter = "twitter"
@@ -13,7 +22,7 @@ class Platform(StrEnum):
     tiktok = "tiktok"
 
 
-class ContentStream(StrEnum):
+class ContentStream(_LookupStrEnum):
     """Content stream categories."""
 
     project_marketing = "project_marketing"
@@ -23,7 +32,7 @@ class ContentStream(StrEnum):
     technical_ai = "technical_ai"
 
 
-class ApprovalStatus(StrEnum):
+class ApprovalStatus(_LookupStrEnum):
     """Post approval workflow statuses."""
 
     pending = "pending"
@@ -32,7 +41,7 @@ class ApprovalStatus(StrEnum):
     rejected = "rejected"
 
 
-class PublishStatus(StrEnum):
+class PublishStatus(_LookupStrEnum):
     """Post publishing statuses."""
 
     pending = "pending"
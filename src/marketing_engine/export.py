@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import io
 import json
 from datetime import date
 from itertools import groupby
+from operator import itemgetter
 
 from marketing_engine.db import Database
 from marketing_engine.enums import ApprovalStatus
 from marketing_engine.models import PostDraft
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, see the "fast" extra
+    orjson = None
+
 
 def export_approved(db: Database, week_of: date, fmt: str = "json") -> str:
     """Export approved and edited posts for a given week.
@@ -38,6 +45,8 @@ def _export_json(posts: list[PostDraft]) -> str:
     """Export posts as a JSON array.
 
     Uses the effective content (edited_content if available, else content).
+    Serializes with orjson when it is installed, else the stdlib json module;
+    both write non-ASCII text as raw UTF-8, so the output is identical.
     """
     items = []
     for post in posts:
@@ -57,59 +66,57 @@ def _export_json(posts: list[PostDraft]) -> str:
                 "status": post.approval_status.value,
             }
         )
-    return json.dumps(items, indent=2)
+    if orjson is not None:
+        return orjson.dumps(items, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(items, indent=2, ensure_ascii=False)
+
+
+def _day_label(post: PostDraft) -> str:
+    """Return the markdown day heading for a post."""
+    if post.scheduled_time:
+        return post.scheduled_time.strftime("%A, %B %d")
+    return "Unscheduled"
 
 
 def _export_markdown(posts: list[PostDraft]) -> str:
-    """Export posts as markdown grouped by day with platform badges."""
+    """Export posts as markdown grouped by day with platform badges.
+
+    Posts must already be ordered by scheduled time, as ``Database.get_queue``
+    returns them; days are grouped in the order they first appear.
+    """
     if not posts:
         return "# Weekly Content Queue\n\nNo approved posts for this week.\n"
 
-    # Sort by scheduled time
-    sorted_posts = sorted(
-        posts,
-        key=lambda p: p.scheduled_time.isoformat() if p.scheduled_time else "",
-    )
-
-    lines = ["# Weekly Content Queue", ""]
-
-    # Group by day
-    def day_key(post: PostDraft) -> str:
-        if post.scheduled_time:
-            return post.scheduled_time.strftime("%A, %B %d")
-        return "Unscheduled"
+    buf = io.StringIO()
+    w = buf.write
+    # Every block after the title starts with the blank line that separates it.
+    w("# Weekly Content Queue\n")
 
-    for day, day_posts in groupby(sorted_posts, key=day_key):
-        lines.append(f"## {day}")
-        lines.append("")
+    labelled = [(_day_label(p), p) for p in posts]
+    for day, group in groupby(labelled, key=itemgetter(0)):
+        w(f"\n## {day}\n")
 
-        for post in day_posts:
+        for _, post in group:
             platform_badge = f"[{post.platform.value.upper()}]"
             stream_badge = f"({post.stream.value})"
             time_str = post.scheduled_time.strftime("%I:%M %p") if post.scheduled_time else "TBD"
             effective_content = post.edited_content or post.content
 
-            lines.append(f"### {time_str} {platform_badge} {stream_badge}")
-            lines.append("")
-            lines.append(effective_content)
-            lines.append("")
+            w(f"\n### {time_str} {platform_badge} {stream_badge}\n")
+            w(f"\n{effective_content}\n")
 
             if post.hashtags:
                 tags = " ".join(
                     f"#{tag}" if not tag.startswith("#") else tag for tag in post.hashtags
                 )
-                lines.append(f"**Tags:** {tags}")
-                lines.append("")
+                w(f"\n**Tags:** {tags}\n")
 
             if post.cta_url:
-                lines.append(f"**CTA:** {post.cta_url}")
-                lines.append("")
+                w(f"\n**CTA:** {post.cta_url}\n")
 
             if post.subreddit:
-                lines.append(f"**Subreddit:** r/{post.subreddit}")
-                lines.append("")
+                w(f"\n**Subreddit:** r/{post.subreddit}\n")
 
-            lines.append("---")
-            lines.append("")
+            w("\n---\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
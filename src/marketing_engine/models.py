@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from datetime import UTC, date, datetime
+from operator import attrgetter
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
@@ -77,17 +79,11 @@ class WeeklyQueue(BaseModel):
 
     def total_by_platform(self) -> dict[Platform, int]:
         """Count posts grouped by platform."""
-        counts: dict[Platform, int] = {}
-        for post in self.posts:
-            counts[post.platform] = counts.get(post.platform, 0) + 1
-        return counts
+        return dict(Counter(map(attrgetter("platform"), self.posts)))
 
     def total_by_stream(self) -> dict[ContentStream, int]:
         """Count posts grouped by content stream."""
-        counts: dict[ContentStream, int] = {}
-        for post in self.posts:
-            counts[post.stream] = counts.get(post.stream, 0) + 1
-        return counts
+        return dict(Counter(map(attrgetter("stream"), self.posts)))
 
     def pending_count(self) -> int:
         """Count posts with pending approval status."""
@@ -2,7 +2,9 @@
 
 import json
 from datetime import UTC, date, datetime
+from unittest.mock import patch
 
+import httpx
 import pytest
 
 from marketing_engine.db import Database
@@ -10,15 +12,85 @@ from marketing_engine.enums import ContentStream, Platform
 from marketing_engine.llm.base import MockLLMClient
 from marketing_engine.models import ContentBrief, PipelineRun, PostDraft
 
+# Test databases are throwaway, so trade crash durability for fewer fsyncs.
+_TEST_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
+
+
+def _configure_test_db(db: Database) -> Database:
+    """Apply the fast, non-durable test PRAGMAs to a Database's connection."""
+    conn = db._get_conn()
+    for pragma in _TEST_PRAGMAS:
+        conn.execute(pragma)
+    return db
+
 
 @pytest.fixture()
-def tmp_db(tmp_path):
-    """Create a temporary Database and close it after the test."""
-    db = Database(tmp_path / "test.db")
+def tmp_db():
+    """Create an in-memory Database and close it after the test.
+
+    Each thread's connection would open a separate in-memory database, which is
+    fine because tests drive a Database from a single thread. Tests that need
+    on-disk behaviour such as WAL build their own Database under ``tmp_path``.
+    """
+    db = _configure_test_db(Database(":memory:"))
+    yield db
+    db.close()
+
+
+@pytest.fixture(scope="class")
+def class_db(tmp_path_factory):
+    """Create one Database per test class for tests that share a single setup."""
+    db = _configure_test_db(Database(tmp_path_factory.mktemp("db") / "test.db"))
     yield db
     db.close()
 
 
+@pytest.fixture(scope="module")
+def module_db(tmp_path_factory):
+    """Create one Database per test module so the schema DDL runs only once."""
+    db = _configure_test_db(Database(tmp_path_factory.mktemp("db") / "test.db"))
+    yield db
+    db.close()
+
+
+@pytest.fixture()
+def rollback_db(module_db):
+    """Yield the module Database inside a savepoint that is rolled back afterwards.
+
+    Database runs in autocommit mode, so writes made during the test join the
+    savepoint's transaction and vanish on rollback.
+    """
+    conn = module_db._get_conn()
+    conn.execute("SAVEPOINT test")
+    yield module_db
+    conn.execute("ROLLBACK TO test")
+    conn.execute("RELEASE test")
+
+
+@pytest.fixture(scope="module")
+def _patched_post():
+    """Patch ``httpx.post`` once per test module.
+
+    Every publisher calls ``httpx.post`` through the shared ``httpx`` module, so
+    this one patch covers them all. Patches live in the worker process, so this
+    is safe under ``pytest -n``.
+    """
+    with patch.object(httpx, "post") as mock:
+        yield mock
+
+
+@pytest.fixture()
+def mock_post(_patched_post):
+    """Return the module's httpx.post mock with calls, return value and side effect reset."""
+    _patched_post.reset_mock(return_value=True, side_effect=True)
+    return _patched_post
+
+
 @pytest.fixture()
 def mock_llm():
     """Return a MockLLMClient with canned responses for research, draft, and format stages."""
@@ -53,9 +125,12 @@ def mock_llm():
     return MockLLMClient(responses)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def sample_brief():
-    """Return a ContentBrief with realistic data."""
+    """Return a ContentBrief with realistic data.
+
+    Session-scoped: treat the returned instance as immutable.
+    """
     return ContentBrief(
         topic="How to build a CLI in Python",
         angle="Focus on Typer + Rich for modern UX",
@@ -66,9 +141,12 @@ def sample_brief():
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def sample_post(sample_brief):
-    """Return a PostDraft with realistic data (pending status, scheduled_time set)."""
+    """Return a PostDraft with realistic data (pending status, scheduled_time set).
+
+    Session-scoped: treat the returned instance as immutable.
+    """
     return PostDraft(
         brief_id=sample_brief.id,
         stream=ContentStream.project_marketing,
@@ -80,9 +158,12 @@ def sample_post(sample_brief):
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def sample_pipeline_run():
-    """Return a PipelineRun with week_of=date(2025, 3, 3)."""
+    """Return a PipelineRun with week_of=date(2025, 3, 3).
+
+    Session-scoped: treat the returned instance as immutable.
+    """
     return PipelineRun(week_of=date(2025, 3, 3))
 
 
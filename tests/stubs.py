@@ -0,0 +1,41 @@
+"""Lightweight test doubles shared across the publisher tests."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TypeVar
+
+from marketing_engine.publishers.base import PlatformPublisher
+
+_P = TypeVar("_P", bound=PlatformPublisher)
+
+
+class FakeResponse:
+    """Minimal stand-in for the parts of ``httpx.Response`` the publishers read."""
+
+    __slots__ = ("status_code", "headers", "text", "_json")
+
+    def __init__(
+        self,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+        text: str = "",
+        json: dict | None = None,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers if headers is not None else {}
+        self.text = text
+        self._json = json if json is not None else {}
+
+    def json(self) -> dict:
+        return self._json
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+def publisher_with(cls: type[_P], creds: Mapping[str, str | None]) -> _P:
+    """Build a ``cls`` publisher holding a copy of ``creds``, skipping the env lookup."""
+    pub = cls.__new__(cls)
+    pub._creds = dict(creds)
+    return pub
@@ -196,6 +196,14 @@ class TestExport:
         assert result.exit_code == 0
         assert "No approved posts" in result.output
 
+    def test_output_file_written_as_utf8(self, tmp_path):
+        out = tmp_path / "queue.json"
+        with patch("marketing_engine.export.export_approved", return_value='["Café 🚀"]'):
+            result = runner.invoke(app, ["export", "--week", "2025-03-03", "-o", str(out)])
+
+        assert result.exit_code == 0
+        assert out.read_bytes().decode("utf-8") == '["Café 🚀"]'
+
 
 # ---------------------------------------------------------------------------
 # approve / reject
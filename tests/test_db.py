@@ -4,8 +4,11 @@ from __future__ import annotations
 
 from datetime import UTC, date, datetime
 
+import pytest
+
 from marketing_engine.db import Database
 from marketing_engine.enums import ApprovalStatus, ContentStream, Platform
+from marketing_engine.exceptions import DatabaseError
 from marketing_engine.models import PipelineRun, PostDraft
 
 # --- Schema ---
@@ -33,9 +36,10 @@ class TestSchema:
         ).fetchone()
         assert row is not None
 
-    def test_wal_mode_enabled(self, tmp_db):
-        conn = tmp_db._get_conn()
-        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    def test_wal_mode_enabled(self, tmp_path):
+        db = Database(tmp_path / "wal.db")
+        mode = db._get_conn().execute("PRAGMA journal_mode").fetchone()[0]
+        db.close()
         assert mode == "wal"
 
     def test_foreign_keys_enabled(self, tmp_db):
@@ -89,6 +93,89 @@ class TestSaveDraft:
         assert row["platform"] == sample_post.platform.value
 
 
+class TestSaveDraftsBulk:
+    def test_inserts_all_and_returns_ids(self, tmp_db, sample_brief, sample_pipeline_run):
+        tmp_db.save_pipeline_run(sample_pipeline_run)
+        tmp_db.save_brief(sample_brief, sample_pipeline_run.id)
+        drafts = [
+            PostDraft(
+                brief_id=sample_brief.id,
+                stream=ContentStream.project_marketing,
+                platform=Platform.twitter,
+                content=f"Bulk {i}",
+            )
+            for i in range(3)
+        ]
+
+        ids = tmp_db.save_drafts_bulk(drafts, sample_pipeline_run.id)
+
+        assert ids == [d.id for d in drafts]
+        count = tmp_db._get_conn().execute("SELECT COUNT(*) FROM post_drafts").fetchone()[0]
+        assert count == 3
+
+    def test_failure_rolls_back_whole_batch(
+        self, tmp_db, sample_post, sample_brief, sample_pipeline_run
+    ):
+        tmp_db.save_pipeline_run(sample_pipeline_run)
+        tmp_db.save_brief(sample_brief, sample_pipeline_run.id)
+
+        with pytest.raises(DatabaseError):
+            tmp_db.save_drafts_bulk([sample_post, sample_post], sample_pipeline_run.id)
+
+        count = tmp_db._get_conn().execute("SELECT COUNT(*) FROM post_drafts").fetchone()[0]
+        assert count == 0
+
+
+class TestTransaction:
+    def _count_runs(self, db):
+        return db._get_conn().execute("SELECT COUNT(*) FROM pipeline_runs").fetchone()[0]
+
+    def test_commits_on_success(self, tmp_db):
+        with tmp_db.transaction():
+            tmp_db.save_pipeline_run(PipelineRun(week_of=date(2025, 3, 3)))
+            tmp_db.save_pipeline_run(PipelineRun(week_of=date(2025, 3, 10)))
+
+        assert not tmp_db._get_conn().in_transaction
+        assert self._count_runs(tmp_db) == 2
+
+    def test_rolls_back_on_error(self, tmp_db):
+        with pytest.raises(RuntimeError), tmp_db.transaction():
+            tmp_db.save_pipeline_run(PipelineRun(week_of=date(2025, 3, 3)))
+            raise RuntimeError("boom")
+
+        assert self._count_runs(tmp_db) == 0
+
+    def test_nested_joins_outer_transaction(self, tmp_db):
+        with pytest.raises(RuntimeError), tmp_db.transaction():
+            with tmp_db.transaction():
+                tmp_db.save_pipeline_run(PipelineRun(week_of=date(2025, 3, 3)))
+            raise RuntimeError("boom")
+
+        assert self._count_runs(tmp_db) == 0
+
+    def test_nested_failure_rolls_back_only_inner_block(self, tmp_db):
+        with tmp_db.transaction():
+            tmp_db.save_pipeline_run(PipelineRun(week_of=date(2025, 3, 3)))
+            with pytest.raises(RuntimeError), tmp_db.transaction():
+                tmp_db.save_pipeline_run(PipelineRun(week_of=date(2025, 3, 10)))
+                raise RuntimeError("boom")
+
+        assert self._count_runs(tmp_db) == 1
+
+    def test_nested_bulk_failure_keeps_no_partial_batch(
+        self, tmp_db, sample_post, sample_brief, sample_pipeline_run
+    ):
+        with tmp_db.transaction():
+            tmp_db.save_pipeline_run(sample_pipeline_run)
+            tmp_db.save_brief(sample_brief, sample_pipeline_run.id)
+            with pytest.raises(DatabaseError):
+                tmp_db.save_drafts_bulk([sample_post, sample_post], sample_pipeline_run.id)
+
+        count = tmp_db._get_conn().execute("SELECT COUNT(*) FROM post_drafts").fetchone()[0]
+        assert count == 0
+        assert self._count_runs(tmp_db) == 1
+
+
 # --- save_pipeline_run ---
 
 
@@ -328,6 +415,18 @@ class TestGetPost:
         assert post.id == sample_post.id
         assert post.content == sample_post.content
 
+    def test_matches_fully_validated_model(
+        self, tmp_db, sample_post, sample_brief, sample_pipeline_run
+    ):
+        tmp_db.save_pipeline_run(sample_pipeline_run)
+        tmp_db.save_brief(sample_brief, sample_pipeline_run.id)
+        tmp_db.save_draft(sample_post, sample_pipeline_run.id)
+
+        fetched = tmp_db.get_post(sample_post.id)
+
+        assert fetched == PostDraft.model_validate(fetched.model_dump())
+        assert fetched == sample_post
+
     def test_returns_none_for_nonexistent(self, tmp_db):
         assert tmp_db.get_post("does-not-exist") is None
 
@@ -2,14 +2,41 @@
 
 from __future__ import annotations
 
+import sqlite3
 from datetime import UTC, datetime
 
 import pytest
 
+from marketing_engine.db import _SELECT_PUBLISH_HISTORY_SQL, Database
 from marketing_engine.enums import ApprovalStatus, ContentStream, Platform, PublishStatus
 from marketing_engine.models import PostDraft
 from marketing_engine.publishers.result import PublishResult
 
+_DEFAULT_SCHEDULED = datetime(2025, 3, 4, 14, 0, tzinfo=UTC)
+_DEFAULT_CREATED = datetime(2025, 3, 3, 12, 0, tzinfo=UTC)
+_DUE_SCHEDULED = datetime(2025, 3, 4, 10, 0, tzinfo=UTC)
+_NOW = datetime(2025, 3, 4, 12, 0, tzinfo=UTC)
+
+_TEMPLATE_POST = PostDraft(
+    id="tmpl",
+    brief_id="tmpl",
+    stream=ContentStream.project_marketing,
+    platform=Platform.twitter,
+    content="Post tmpl",
+    approval_status=ApprovalStatus.approved,
+    publish_status=PublishStatus.pending,
+    scheduled_time=_DEFAULT_SCHEDULED,
+    created_at=_DEFAULT_CREATED,
+    updated_at=_DEFAULT_CREATED,
+)
+
+_TEMPLATE_RESULT = PublishResult(
+    success=True,
+    platform=Platform.twitter,
+    post_id="tmpl",
+    published_at=_DEFAULT_SCHEDULED,
+)
+
 
 def _make_post(
     brief_id: str,
@@ -19,26 +46,30 @@ def _make_post(
     publish_status: PublishStatus = PublishStatus.pending,
     scheduled_time: datetime | None = None,
 ) -> PostDraft:
-    return PostDraft(
-        id=post_id,
-        brief_id=brief_id,
-        stream=ContentStream.project_marketing,
-        platform=platform,
-        content=f"Post {post_id}",
-        approval_status=approval_status,
-        publish_status=publish_status,
-        scheduled_time=scheduled_time or datetime(2025, 3, 4, 14, 0, tzinfo=UTC),
-        created_at=datetime(2025, 3, 3, 12, 0, tzinfo=UTC),
-        updated_at=datetime(2025, 3, 3, 12, 0, tzinfo=UTC),
-    )
+    update = {
+        "id": post_id,
+        "brief_id": brief_id,
+        "platform": platform,
+        "content": f"Post {post_id}",
+        "approval_status": approval_status,
+        "publish_status": publish_status,
+    }
+    if scheduled_time is not None:
+        update["scheduled_time"] = scheduled_time
+    return _TEMPLATE_POST.model_copy(update=update)
+
+
+def _make_result(**overrides: object) -> PublishResult:
+    return _TEMPLATE_RESULT.model_copy(update=overrides)
 
 
 @pytest.fixture()
-def _db_setup(tmp_db, sample_brief, sample_pipeline_run):
+def _db_setup(rollback_db, sample_brief, sample_pipeline_run):
     """Insert pipeline run and brief so foreign keys are satisfied."""
-    tmp_db.save_pipeline_run(sample_pipeline_run)
-    tmp_db.save_brief(sample_brief, sample_pipeline_run.id)
-    return tmp_db, sample_brief, sample_pipeline_run
+    with rollback_db.transaction():
+        rollback_db.save_pipeline_run(sample_pipeline_run)
+        rollback_db.save_brief(sample_brief, sample_pipeline_run.id)
+    return rollback_db, sample_brief, sample_pipeline_run
 
 
 # ---------------------------------------------------------------------------
@@ -53,11 +84,11 @@ class TestGetPublishable:
             brief.id,
             approval_status=ApprovalStatus.approved,
             publish_status=PublishStatus.pending,
-            scheduled_time=datetime(2025, 3, 4, 10, 0, tzinfo=UTC),
+            scheduled_time=_DUE_SCHEDULED,
         )
         db.save_draft(post, run.id)
 
-        result = db.get_publishable(datetime(2025, 3, 4, 12, 0, tzinfo=UTC))
+        result = db.get_publishable(_NOW)
 
         assert len(result) == 1
         assert result[0].id == post.id
@@ -69,93 +100,59 @@ class TestGetPublishable:
             post_id="edited-1",
             approval_status=ApprovalStatus.edited,
             publish_status=PublishStatus.pending,
-            scheduled_time=datetime(2025, 3, 4, 10, 0, tzinfo=UTC),
+            scheduled_time=_DUE_SCHEDULED,
         )
         db.save_draft(post, run.id)
 
-        result = db.get_publishable(datetime(2025, 3, 4, 12, 0, tzinfo=UTC))
+        result = db.get_publishable(_NOW)
 
         assert len(result) == 1
         assert result[0].id == "edited-1"
 
-    def test_excludes_pending_approval(self, _db_setup):
-        db, brief, run = _db_setup
-        post = _make_post(
-            brief.id,
-            post_id="unapproved",
-            approval_status=ApprovalStatus.pending,
-            publish_status=PublishStatus.pending,
-            scheduled_time=datetime(2025, 3, 4, 10, 0, tzinfo=UTC),
-        )
-        db.save_draft(post, run.id)
-
-        result = db.get_publishable(datetime(2025, 3, 4, 12, 0, tzinfo=UTC))
-
-        assert result == []
-
-    def test_excludes_rejected(self, _db_setup):
-        db, brief, run = _db_setup
-        post = _make_post(
-            brief.id,
-            post_id="rejected-1",
-            approval_status=ApprovalStatus.rejected,
-            publish_status=PublishStatus.pending,
-            scheduled_time=datetime(2025, 3, 4, 10, 0, tzinfo=UTC),
-        )
-        db.save_draft(post, run.id)
-
-        result = db.get_publishable(datetime(2025, 3, 4, 12, 0, tzinfo=UTC))
-
-        assert result == []
-
-    def test_excludes_already_published(self, _db_setup):
-        db, brief, run = _db_setup
-        post = _make_post(
-            brief.id,
-            post_id="already-pub",
-            approval_status=ApprovalStatus.approved,
-            publish_status=PublishStatus.published,
-            scheduled_time=datetime(2025, 3, 4, 10, 0, tzinfo=UTC),
-        )
-        db.save_draft(post, run.id)
-
-        result = db.get_publishable(datetime(2025, 3, 4, 12, 0, tzinfo=UTC))
-
-        assert result == []
-
-    def test_excludes_failed_publish(self, _db_setup):
+    @pytest.mark.parametrize(
+        ("approval_status", "publish_status", "scheduled_time"),
+        [
+            (ApprovalStatus.pending, PublishStatus.pending, _DUE_SCHEDULED),
+            (ApprovalStatus.rejected, PublishStatus.pending, _DUE_SCHEDULED),
+            (ApprovalStatus.approved, PublishStatus.published, _DUE_SCHEDULED),
+            (ApprovalStatus.approved, PublishStatus.failed, _DUE_SCHEDULED),
+            (
+                ApprovalStatus.approved,
+                PublishStatus.pending,
+                datetime(2025, 3, 5, 10, 0, tzinfo=UTC),
+            ),
+        ],
+        ids=[
+            "pending_approval",
+            "rejected",
+            "already_published",
+            "failed_publish",
+            "future_scheduled",
+        ],
+    )
+    def test_excludes(self, _db_setup, approval_status, publish_status, scheduled_time):
         db, brief, run = _db_setup
-        post = _make_post(
+        included = _make_post(
             brief.id,
-            post_id="failed-pub",
-            approval_status=ApprovalStatus.approved,
-            publish_status=PublishStatus.failed,
-            scheduled_time=datetime(2025, 3, 4, 10, 0, tzinfo=UTC),
+            post_id="included",
+            scheduled_time=_DUE_SCHEDULED,
         )
-        db.save_draft(post, run.id)
-
-        result = db.get_publishable(datetime(2025, 3, 4, 12, 0, tzinfo=UTC))
-
-        assert result == []
-
-    def test_excludes_future_scheduled(self, _db_setup):
-        db, brief, run = _db_setup
-        post = _make_post(
+        excluded = _make_post(
             brief.id,
-            post_id="future-1",
-            approval_status=ApprovalStatus.approved,
-            publish_status=PublishStatus.pending,
-            scheduled_time=datetime(2025, 3, 5, 10, 0, tzinfo=UTC),
+            post_id="excluded",
+            approval_status=approval_status,
+            publish_status=publish_status,
+            scheduled_time=scheduled_time,
         )
-        db.save_draft(post, run.id)
+        db.save_drafts_bulk([included, excluded], run.id)
 
-        result = db.get_publishable(datetime(2025, 3, 4, 12, 0, tzinfo=UTC))
+        result = db.get_publishable(_NOW)
 
-        assert result == []
+        assert [p.id for p in result] == ["included"]
 
     def test_includes_exactly_at_now(self, _db_setup):
         db, brief, run = _db_setup
-        exact_time = datetime(2025, 3, 4, 14, 0, tzinfo=UTC)
+        exact_time = _DEFAULT_SCHEDULED
         post = _make_post(
             brief.id,
             post_id="exact-time",
@@ -190,10 +187,29 @@ class TestGetPublishable:
         assert result[0].id == "early"
         assert result[1].id == "late"
 
+    def test_iter_publishable_streams_in_batches(self, _db_setup):
+        db, brief, run = _db_setup
+        db.save_drafts_bulk(
+            [
+                _make_post(
+                    brief.id,
+                    post_id=f"batch-{i}",
+                    scheduled_time=datetime(2025, 3, 4, 8, i, tzinfo=UTC),
+                )
+                for i in range(5)
+            ],
+            run.id,
+        )
+
+        result = db.iter_publishable(_NOW, batch_size=2)
+
+        assert not isinstance(result, list)
+        assert [p.id for p in result] == [f"batch-{i}" for i in range(5)]
+
     def test_empty_table_returns_empty(self, _db_setup):
         db, _, _ = _db_setup
 
-        result = db.get_publishable(datetime(2025, 3, 4, 12, 0, tzinfo=UTC))
+        result = db.get_publishable(_NOW)
 
         assert result == []
 
@@ -305,182 +321,170 @@ class TestUpdatePublishStatus:
 
 
 class TestSavePublishLog:
-    def test_saves_success_entry(self, tmp_db):
-        result = PublishResult(
-            success=True,
-            platform=Platform.twitter,
+    def test_saves_success_entry(self, rollback_db):
+        result = _make_result(
             post_id="log-post-1",
             platform_post_id="plat-id-1",
             post_url="https://twitter.com/post/1",
-            published_at=datetime(2025, 3, 4, 14, 0, tzinfo=UTC),
         )
 
-        tmp_db.save_publish_log(result)
+        rollback_db.save_publish_log(result)
 
-        history = tmp_db.get_publish_history()
+        history = rollback_db.get_publish_history()
         assert len(history) == 1
         assert history[0]["post_id"] == "log-post-1"
         assert history[0]["status"] == "published"
 
-    def test_saves_failure_entry(self, tmp_db):
-        result = PublishResult(
+    def test_saves_failure_entry(self, rollback_db):
+        result = _make_result(
             success=False,
             platform=Platform.linkedin,
             post_id="log-fail-1",
             error="Connection refused",
+            published_at=None,
         )
 
-        tmp_db.save_publish_log(result)
+        rollback_db.save_publish_log(result)
 
-        history = tmp_db.get_publish_history()
+        history = rollback_db.get_publish_history()
         assert len(history) == 1
         assert history[0]["status"] == "failed"
         assert history[0]["error"] == "Connection refused"
 
-    def test_saves_platform(self, tmp_db):
-        result = PublishResult(
-            success=True,
+    def test_saves_platform(self, rollback_db):
+        result = _make_result(
             platform=Platform.reddit,
             post_id="reddit-post",
-            published_at=datetime(2025, 3, 4, 14, 0, tzinfo=UTC),
         )
 
-        tmp_db.save_publish_log(result)
+        rollback_db.save_publish_log(result)
 
-        history = tmp_db.get_publish_history()
+        history = rollback_db.get_publish_history()
         assert history[0]["platform"] == "reddit"
 
-    def test_saves_post_url(self, tmp_db):
-        result = PublishResult(
-            success=True,
-            platform=Platform.twitter,
+    def test_saves_post_url(self, rollback_db):
+        result = _make_result(
             post_id="url-post",
             post_url="https://twitter.com/status/999",
-            published_at=datetime(2025, 3, 4, 14, 0, tzinfo=UTC),
         )
 
-        tmp_db.save_publish_log(result)
+        rollback_db.save_publish_log(result)
 
-        history = tmp_db.get_publish_history()
+        history = rollback_db.get_publish_history()
         assert history[0]["post_url"] == "https://twitter.com/status/999"
 
-    def test_saves_platform_post_id(self, tmp_db):
-        result = PublishResult(
-            success=True,
-            platform=Platform.twitter,
+    def test_saves_platform_post_id(self, rollback_db):
+        result = _make_result(
             post_id="plat-log",
             platform_post_id="ext-id-42",
-            published_at=datetime(2025, 3, 4, 14, 0, tzinfo=UTC),
         )
 
-        tmp_db.save_publish_log(result)
+        rollback_db.save_publish_log(result)
 
-        history = tmp_db.get_publish_history()
+        history = rollback_db.get_publish_history()
         assert history[0]["platform_post_id"] == "ext-id-42"
 
-    def test_saves_published_at(self, tmp_db):
+    def test_saves_published_at(self, rollback_db):
         ts = datetime(2025, 3, 4, 14, 30, tzinfo=UTC)
-        result = PublishResult(
-            success=True,
-            platform=Platform.twitter,
+        result = _make_result(
             post_id="ts-log",
             published_at=ts,
         )
 
-        tmp_db.save_publish_log(result)
+        rollback_db.save_publish_log(result)
 
-        history = tmp_db.get_publish_history()
+        history = rollback_db.get_publish_history()
         assert history[0]["published_at"] == ts.isoformat()
 
 
 class TestGetPublishHistory:
-    def test_empty_returns_empty(self, tmp_db):
-        assert tmp_db.get_publish_history() == []
-
-    def test_returns_dicts(self, tmp_db):
-        result = PublishResult(
-            success=True,
-            platform=Platform.twitter,
-            post_id="dict-test",
-            published_at=datetime(2025, 3, 4, 14, 0, tzinfo=UTC),
-        )
-        tmp_db.save_publish_log(result)
+    def test_empty_returns_empty(self, rollback_db):
+        assert rollback_db.get_publish_history() == []
+
+    def test_returns_dicts(self, rollback_db):
+        result = _make_result(post_id="dict-test")
+        rollback_db.save_publish_log(result)
 
-        history = tmp_db.get_publish_history()
+        history = rollback_db.get_publish_history()
 
         assert isinstance(history[0], dict)
 
-    def test_ordered_by_published_at_desc(self, tmp_db):
-        r1 = PublishResult(
-            success=True,
-            platform=Platform.twitter,
+    def test_ordered_by_published_at_desc(self, rollback_db):
+        r1 = _make_result(
             post_id="old",
             published_at=datetime(2025, 3, 3, 10, 0, tzinfo=UTC),
         )
-        r2 = PublishResult(
-            success=True,
-            platform=Platform.twitter,
+        r2 = _make_result(
             post_id="new",
             published_at=datetime(2025, 3, 4, 10, 0, tzinfo=UTC),
         )
-        tmp_db.save_publish_log(r1)
-        tmp_db.save_publish_log(r2)
+        rollback_db.save_publish_log(r1)
+        rollback_db.save_publish_log(r2)
 
-        history = tmp_db.get_publish_history()
+        history = rollback_db.get_publish_history()
 
         assert len(history) == 2
         assert history[0]["post_id"] == "new"
         assert history[1]["post_id"] == "old"
 
-    def test_limit_parameter(self, tmp_db):
-        for i in range(5):
-            r = PublishResult(
-                success=True,
-                platform=Platform.twitter,
-                post_id=f"limit-{i}",
-                published_at=datetime(2025, 3, 4, 10 + i, 0, tzinfo=UTC),
-            )
-            tmp_db.save_publish_log(r)
+    def test_limit_parameter(self, rollback_db):
+        rollback_db.save_publish_logs_bulk(
+            [
+                _make_result(
+                    post_id=f"limit-{i}",
+                    published_at=datetime(2025, 3, 4, 10 + i, 0, tzinfo=UTC),
+                )
+                for i in range(5)
+            ]
+        )
 
-        history = tmp_db.get_publish_history(limit=2)
+        history = rollback_db.get_publish_history(limit=2)
 
         assert len(history) == 2
 
-    def test_default_limit_is_20(self, tmp_db):
-        for i in range(25):
-            r = PublishResult(
-                success=True,
-                platform=Platform.twitter,
-                post_id=f"def-{i}",
-                published_at=datetime(2025, 3, 4, 0, i, tzinfo=UTC),
-            )
-            tmp_db.save_publish_log(r)
+    def test_default_limit_is_20(self, rollback_db):
+        rollback_db.save_publish_logs_bulk(
+            [
+                _make_result(
+                    post_id=f"def-{i}",
+                    published_at=datetime(2025, 3, 4, 0, i, tzinfo=UTC),
+                )
+                for i in range(25)
+            ]
+        )
 
-        history = tmp_db.get_publish_history()
+        history = rollback_db.get_publish_history()
 
         assert len(history) == 20
 
-    def test_history_contains_all_fields(self, tmp_db):
-        result = PublishResult(
-            success=True,
+    def test_history_contains_all_fields(self, rollback_db):
+        result = _make_result(
             platform=Platform.linkedin,
             post_id="full-log",
             platform_post_id="li-42",
             post_url="https://linkedin.com/post/42",
-            published_at=datetime(2025, 3, 4, 14, 0, tzinfo=UTC),
         )
-        tmp_db.save_publish_log(result)
-
-        entry = tmp_db.get_publish_history()[0]
-
-        assert "id" in entry
+        rollback_db.save_publish_log(result)
+
+        entry = rollback_db.get_publish_history()[0]
+
+        assert {
+            "id",
+            "post_id",
+            "platform",
+            "status",
+            "platform_post_id",
+            "post_url",
+            "published_at",
+            "error",
+        }.issubset(entry)
+        assert entry["error"] is None
+        assert entry["published_at"] is not None
         assert entry["post_id"] == "full-log"
         assert entry["platform"] == "linkedin"
         assert entry["status"] == "published"
         assert entry["platform_post_id"] == "li-42"
         assert entry["post_url"] == "https://linkedin.com/post/42"
-        assert entry["published_at"] is not None
-        assert entry["error"] is None
 
 
 # ---------------------------------------------------------------------------
@@ -502,3 +506,85 @@ class TestPublishLogSchema:
             "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_publish_log_post'"
         ).fetchone()
         assert row is not None
+
+    def test_publish_log_epoch_index_exists(self, tmp_db):
+        conn = tmp_db._get_conn()
+        row = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' "
+            "AND name='idx_publish_log_published_at_epoch'"
+        ).fetchone()
+        assert row is not None
+
+    def test_history_query_walks_epoch_index_without_sort(self, tmp_db):
+        plan = (
+            tmp_db._get_conn()
+            .execute("EXPLAIN QUERY PLAN " + _SELECT_PUBLISH_HISTORY_SQL, (20,))
+            .fetchall()
+        )
+        details = " ".join(row["detail"] for row in plan)
+
+        assert "idx_publish_log_published_at_epoch" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_saves_published_at_epoch(self, tmp_db):
+        ts = datetime(2025, 3, 4, 14, 30, tzinfo=UTC)
+        tmp_db.save_publish_log(_make_result(post_id="ep", published_at=ts))
+
+        entry = tmp_db.get_publish_history()[0]
+
+        assert entry["published_at_epoch"] == int(ts.timestamp()) * 1_000_000
+
+    def test_naive_published_at_epoch_treated_as_utc(self, tmp_db):
+        naive = datetime(2025, 3, 4, 14, 30)
+        tmp_db.save_publish_log(_make_result(post_id="naive", published_at=naive))
+
+        entry = tmp_db.get_publish_history()[0]
+
+        assert entry["published_at_epoch"] == 1_741_098_600_000_000
+
+    def test_legacy_publish_log_migrated_and_backfilled(self, tmp_path):
+        path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(path)
+        conn.execute(
+            """CREATE TABLE publish_log (
+                id TEXT PRIMARY KEY, post_id TEXT NOT NULL, platform TEXT NOT NULL,
+                status TEXT NOT NULL, platform_post_id TEXT, post_url TEXT,
+                error TEXT, published_at TEXT)"""
+        )
+        conn.execute(
+            "INSERT INTO publish_log (id, post_id, platform, status, published_at) "
+            "VALUES ('1', 'legacy', 'twitter', 'published', '2025-03-04T14:30:00.750123+00:00')"
+        )
+        conn.commit()
+        conn.close()
+
+        db = Database(path)
+        entry = db.get_publish_history()[0]
+        db.close()
+
+        # 2025-03-04T14:30:00Z is 1741098600 seconds after the epoch.
+        assert entry["published_at_epoch"] == 1_741_098_600_750_123
+
+    def test_legacy_rows_sort_with_new_rows_in_same_second(self, tmp_path):
+        path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(path)
+        conn.execute(
+            """CREATE TABLE publish_log (
+                id TEXT PRIMARY KEY, post_id TEXT NOT NULL, platform TEXT NOT NULL,
+                status TEXT NOT NULL, platform_post_id TEXT, post_url TEXT,
+                error TEXT, published_at TEXT)"""
+        )
+        conn.execute(
+            "INSERT INTO publish_log (id, post_id, platform, status, published_at) "
+            "VALUES ('1', 'legacy', 'twitter', 'published', '2025-03-04T14:30:00.900000+00:00')"
+        )
+        conn.commit()
+        conn.close()
+
+        db = Database(path)
+        earlier = datetime(2025, 3, 4, 14, 30, 0, 100_000, tzinfo=UTC)
+        db.save_publish_log(_make_result(post_id="new", published_at=earlier))
+        history = [e["post_id"] for e in db.get_publish_history()]
+        db.close()
+
+        assert history == ["legacy", "new"]
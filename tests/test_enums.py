@@ -1,65 +1,90 @@
 """Tests for marketing_engine.enums."""
 
+from enum import StrEnum
+
 import pytest
 
 from marketing_engine.enums import ApprovalStatus, ContentStream, Platform
 
+_PLATFORMS = tuple(Platform)
+
 
 class TestPlatform:
     def test_members_count(self):
         assert len(Platform) == 5
 
-    def test_member_values(self):
-        assert Platform.twitter == "twitter"
-        assert Platform.linkedin == "linkedin"
-        assert Platform.reddit == "reddit"
-        assert Platform.youtube == "youtube"
-        assert Platform.tiktok == "tiktok"
-
-    def test_str_equality(self):
-        assert str(Platform.twitter) == "twitter"
-
-    def test_construct_from_value(self):
-        assert Platform("twitter") == Platform.twitter
+    @pytest.mark.parametrize(
+        ("member", "value"),
+        [
+            (Platform.twitter, "twitter"),
+            (Platform.linkedin, "linkedin"),
+            (Platform.reddit, "reddit"),
+            (Platform.youtube, "youtube"),
+            (Platform.tiktok, "tiktok"),
+        ],
+        ids=["twitter", "linkedin", "reddit", "youtube", "tiktok"],
+    )
+    def test_value(self, member, value):
+        assert member == value
+        assert str(member) == value
+        assert Platform(value) is member
+
+    def test_is_str_enum(self):
+        assert issubclass(Platform, StrEnum)
 
     def test_iteration(self):
-        names = [p.value for p in Platform]
-        assert names == ["twitter", "linkedin", "reddit", "youtube", "tiktok"]
+        assert _PLATFORMS == ("twitter", "linkedin", "reddit", "youtube", "tiktok")
+
+    def test_has_value(self):
+        assert Platform.has_value("twitter")
+        assert not Platform.has_value("instagram")
 
 
 class TestContentStream:
     def test_members_count(self):
         assert len(ContentStream) == 5
 
-    def test_member_values(self):
-        assert ContentStream.project_marketing == "project_marketing"
-        assert ContentStream.benchgoblins == "benchgoblins"
-        assert ContentStream.eve_content == "eve_content"
-        assert ContentStream.linux_tools == "linux_tools"
-        assert ContentStream.technical_ai == "technical_ai"
-
-    def test_str_equality(self):
-        assert str(ContentStream.eve_content) == "eve_content"
-
-    def test_construct_from_value(self):
-        assert ContentStream("benchgoblins") == ContentStream.benchgoblins
+    @pytest.mark.parametrize(
+        ("member", "value"),
+        [
+            (ContentStream.project_marketing, "project_marketing"),
+            (ContentStream.benchgoblins, "benchgoblins"),
+            (ContentStream.eve_content, "eve_content"),
+            (ContentStream.linux_tools, "linux_tools"),
+            (ContentStream.technical_ai, "technical_ai"),
+        ],
+        ids=["project_marketing", "benchgoblins", "eve_content", "linux_tools", "technical_ai"],
+    )
+    def test_value(self, member, value):
+        assert member == value
+        assert str(member) == value
+        assert ContentStream(value) is member
+
+    def test_is_str_enum(self):
+        assert issubclass(ContentStream, StrEnum)
 
 
 class TestApprovalStatus:
     def test_members_count(self):
         assert len(ApprovalStatus) == 4
 
-    def test_member_values(self):
-        assert ApprovalStatus.pending == "pending"
-        assert ApprovalStatus.approved == "approved"
-        assert ApprovalStatus.edited == "edited"
-        assert ApprovalStatus.rejected == "rejected"
-
-    def test_str_equality(self):
-        assert str(ApprovalStatus.approved) == "approved"
-
-    def test_construct_from_value(self):
-        assert ApprovalStatus("rejected") == ApprovalStatus.rejected
+    @pytest.mark.parametrize(
+        ("member", "value"),
+        [
+            (ApprovalStatus.pending, "pending"),
+            (ApprovalStatus.approved, "approved"),
+            (ApprovalStatus.edited, "edited"),
+            (ApprovalStatus.rejected, "rejected"),
+        ],
+        ids=["pending", "approved", "edited", "rejected"],
+    )
+    def test_value(self, member, value):
+        assert member == value
+        assert str(member) == value
+        assert ApprovalStatus(value) is member
+
+    def test_is_str_enum(self):
+        assert issubclass(ApprovalStatus, StrEnum)
 
 
 class TestInvalidValues:
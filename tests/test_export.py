@@ -4,11 +4,28 @@ from __future__ import annotations
 
 import json
 from datetime import UTC, date, datetime
+from uuid import uuid4
 
+import pytest
+
+from marketing_engine import export
 from marketing_engine.enums import ApprovalStatus, ContentStream, Platform
 from marketing_engine.export import _export_json, _export_markdown, export_approved
 from marketing_engine.models import PostDraft
 
+_DEFAULT_SCHEDULED = datetime(2025, 3, 4, 10, 0, tzinfo=UTC)
+
+_TEMPLATE_POST = PostDraft(
+    brief_id="tmpl",
+    stream=ContentStream.project_marketing,
+    platform=Platform.twitter,
+    content="Approved post content.",
+    hashtags=["test"],
+    cta_url="https://example.com",
+    scheduled_time=_DEFAULT_SCHEDULED,
+    approval_status=ApprovalStatus.approved,
+)
+
 
 def _make_post(
     brief_id: str,
@@ -24,26 +41,29 @@ def _make_post(
     subreddit: str | None = None,
 ) -> PostDraft:
     """Build a PostDraft with sensible defaults for export tests."""
-    return PostDraft(
-        brief_id=brief_id,
-        stream=stream,
-        platform=platform,
-        content=content,
-        hashtags=hashtags or ["test"],
-        cta_url=cta_url,
-        subreddit=subreddit,
-        scheduled_time=scheduled_time or datetime(2025, 3, 4, 10, 0, tzinfo=UTC),
-        approval_status=approval_status,
-        edited_content=edited_content,
+    return _TEMPLATE_POST.model_copy(
+        update={
+            "id": str(uuid4()),
+            "brief_id": brief_id,
+            "stream": stream,
+            "platform": platform,
+            "content": content,
+            "hashtags": hashtags or ["test"],
+            "cta_url": cta_url,
+            "subreddit": subreddit,
+            "scheduled_time": scheduled_time or _DEFAULT_SCHEDULED,
+            "approval_status": approval_status,
+            "edited_content": edited_content,
+        }
     )
 
 
 def _seed_db(db, sample_brief, sample_pipeline_run, posts: list[PostDraft]) -> str:
     """Seed database with a pipeline run, brief, and posts."""
-    run_id = db.save_pipeline_run(sample_pipeline_run)
-    db.save_brief(sample_brief, run_id)
-    for post in posts:
-        db.save_draft(post, run_id)
+    with db.transaction():
+        run_id = db.save_pipeline_run(sample_pipeline_run)
+        db.save_brief(sample_brief, run_id)
+        db.save_drafts_bulk(posts, run_id)
     return run_id
 
 
@@ -88,6 +108,26 @@ class TestExportApproved:
         statuses = {p["status"] for p in parsed}
         assert statuses == {"approved", "edited"}
 
+    def test_markdown_ordered_by_scheduled_time(self, tmp_db, sample_brief, sample_pipeline_run):
+        posts = [
+            _make_post(
+                sample_brief.id,
+                scheduled_time=datetime(2025, 3, 5, 9, 0, tzinfo=UTC),
+                content="Wednesday post",
+            ),
+            _make_post(
+                sample_brief.id,
+                scheduled_time=datetime(2025, 3, 4, 9, 0, tzinfo=UTC),
+                content="Tuesday post",
+            ),
+        ]
+        _seed_db(tmp_db, sample_brief, sample_pipeline_run, posts)
+
+        result = export_approved(tmp_db, date(2025, 3, 3), fmt="markdown")
+
+        assert result.count("\n## ") == 2
+        assert result.index("## Tuesday") < result.index("## Wednesday")
+
 
 # ---------------------------------------------------------------------------
 # _export_json
@@ -99,15 +139,16 @@ class TestExportJson:
         post = _make_post(sample_brief.id, hashtags=["python", "cli"])
         result = json.loads(_export_json([post]))
 
-        item = result[0]
-        assert "id" in item
-        assert "platform" in item
-        assert "stream" in item
-        assert "content" in item
-        assert "cta_url" in item
-        assert "hashtags" in item
-        assert "scheduled_time" in item
-        assert "status" in item
+        assert {
+            "id",
+            "platform",
+            "stream",
+            "content",
+            "cta_url",
+            "hashtags",
+            "scheduled_time",
+            "status",
+        }.issubset(result[0])
 
     def test_uses_edited_content_when_available(self, sample_brief):
         post = _make_post(
@@ -129,6 +170,23 @@ class TestExportJson:
         result = _export_json([])
         assert result == "[]"
 
+    def test_stdlib_fallback_matches_orjson(self, sample_brief, monkeypatch):
+        pytest.importorskip("orjson")
+        posts = [
+            _make_post(sample_brief.id, content="Café launch 🚀", hashtags=["python", "cli"]),
+            _make_post(sample_brief.id, edited_content="Ünïcödé ✨", subreddit="r/python"),
+        ]
+        fast = _export_json(posts)
+
+        monkeypatch.setattr(export, "orjson", None)
+        fallback = _export_json(posts)
+
+        assert fast == fallback
+
+    def test_non_ascii_written_unescaped(self, sample_brief):
+        post = _make_post(sample_brief.id, content="Café launch 🚀")
+        assert '"content": "Café launch 🚀"' in _export_json([post])
+
 
 # ---------------------------------------------------------------------------
 # _export_markdown
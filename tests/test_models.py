@@ -1,7 +1,7 @@
 """Tests for marketing_engine.models."""
 
 from datetime import UTC, date, datetime
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 from pydantic import ValidationError
@@ -9,47 +9,77 @@ from pydantic import ValidationError
 from marketing_engine.enums import ApprovalStatus, ContentStream, Platform
 from marketing_engine.models import ContentBrief, PipelineRun, PostDraft, WeeklyQueue
 
+# Captured at import, before any fixture builds a model, so it bounds default timestamps.
+_NOW = datetime.now(UTC)
+
+
+def _draft(
+    platform: Platform,
+    stream: ContentStream,
+    status: ApprovalStatus = ApprovalStatus.pending,
+) -> PostDraft:
+    """Build an unvalidated PostDraft for exercising WeeklyQueue aggregation."""
+    return PostDraft.model_construct(
+        id=str(uuid4()),
+        brief_id="b",
+        stream=stream,
+        platform=platform,
+        content="t",
+        media_urls=[],
+        cta_url="",
+        hashtags=[],
+        subreddit=None,
+        scheduled_time=None,
+        approval_status=status,
+        edited_content=None,
+        rejection_reason=None,
+        created_at=_NOW,
+        updated_at=_NOW,
+    )
+
+
+@pytest.fixture(scope="class")
+def default_brief() -> ContentBrief:
+    """Return a ContentBrief built from required fields only; tests must not mutate it."""
+    return ContentBrief(
+        topic="t",
+        angle="a",
+        target_audience="devs",
+        stream=ContentStream.project_marketing,
+        platforms=[Platform.twitter],
+    )
+
+
+@pytest.fixture(scope="class")
+def default_draft() -> PostDraft:
+    """Return a PostDraft built from required fields only; tests must not mutate it."""
+    return PostDraft(
+        brief_id="abc",
+        stream=ContentStream.eve_content,
+        platform=Platform.reddit,
+        content="Hello world",
+    )
+
 
 class TestContentBrief:
-    def test_default_id_is_uuid(self):
-        brief = ContentBrief(
-            topic="t",
-            angle="a",
-            target_audience="devs",
-            stream=ContentStream.project_marketing,
-            platforms=[Platform.twitter],
-        )
-        UUID(brief.id)
+    def test_default_id_is_uuid(self, default_brief):
+        UUID(default_brief.id)
 
-    def test_default_created_at_is_utc(self):
-        brief = ContentBrief(
-            topic="t",
-            angle="a",
-            target_audience="devs",
-            stream=ContentStream.project_marketing,
-            platforms=[Platform.twitter],
-        )
-        assert brief.created_at.tzinfo is not None
-        before = datetime.now(UTC)
-        assert brief.created_at <= before
+    def test_default_created_at_is_utc(self, default_brief):
+        assert default_brief.created_at.tzinfo is not None
+        after = datetime.now(UTC)
+        assert _NOW <= default_brief.created_at <= after
 
     def test_required_fields(self):
         with pytest.raises(ValidationError):
             ContentBrief()
 
-    def test_relevant_links_defaults_empty(self):
-        brief = ContentBrief(
-            topic="t",
-            angle="a",
-            target_audience="devs",
-            stream=ContentStream.project_marketing,
-            platforms=[Platform.twitter],
-        )
-        assert brief.relevant_links == []
+    def test_relevant_links_defaults_empty(self, default_brief):
+        assert default_brief.relevant_links == []
 
     def test_serialization_roundtrip(self, sample_brief):
         data = sample_brief.model_dump()
-        restored = ContentBrief(**data)
+        restored = ContentBrief.model_validate(data)
         assert restored.id == sample_brief.id
         assert restored.topic == sample_brief.topic
         assert restored.stream == sample_brief.stream
@@ -88,72 +118,36 @@ class TestContentBrief:
 
 
 class TestPostDraft:
-    def test_default_id_is_uuid(self):
-        draft = PostDraft(
-            brief_id="abc",
-            stream=ContentStream.eve_content,
-            platform=Platform.reddit,
-            content="Hello world",
-        )
-        UUID(draft.id)
-
-    def test_default_approval_pending(self):
-        draft = PostDraft(
-            brief_id="abc",
-            stream=ContentStream.eve_content,
-            platform=Platform.reddit,
-            content="Hello world",
-        )
-        assert draft.approval_status == ApprovalStatus.pending
-
-    def test_default_lists_empty(self):
-        draft = PostDraft(
-            brief_id="abc",
-            stream=ContentStream.eve_content,
-            platform=Platform.reddit,
-            content="Hello world",
-        )
-        assert draft.media_urls == []
-        assert draft.hashtags == []
-
-    def test_default_cta_empty_string(self):
-        draft = PostDraft(
-            brief_id="abc",
-            stream=ContentStream.eve_content,
-            platform=Platform.reddit,
-            content="Hello world",
-        )
-        assert draft.cta_url == ""
-
-    def test_optional_fields_none_by_default(self):
-        draft = PostDraft(
-            brief_id="abc",
-            stream=ContentStream.eve_content,
-            platform=Platform.reddit,
-            content="Hello world",
-        )
-        assert draft.scheduled_time is None
-        assert draft.edited_content is None
-        assert draft.rejection_reason is None
-        assert draft.subreddit is None
+    def test_default_id_is_uuid(self, default_draft):
+        UUID(default_draft.id)
+
+    def test_default_approval_pending(self, default_draft):
+        assert default_draft.approval_status == ApprovalStatus.pending
+
+    def test_default_lists_empty(self, default_draft):
+        assert default_draft.media_urls == []
+        assert default_draft.hashtags == []
+
+    def test_default_cta_empty_string(self, default_draft):
+        assert default_draft.cta_url == ""
+
+    def test_optional_fields_none_by_default(self, default_draft):
+        assert default_draft.scheduled_time is None
+        assert default_draft.edited_content is None
+        assert default_draft.rejection_reason is None
+        assert default_draft.subreddit is None
 
     def test_required_fields(self):
         with pytest.raises(ValidationError):
             PostDraft()
 
-    def test_timestamps_are_utc(self):
-        draft = PostDraft(
-            brief_id="abc",
-            stream=ContentStream.eve_content,
-            platform=Platform.reddit,
-            content="Hello world",
-        )
-        assert draft.created_at.tzinfo is not None
-        assert draft.updated_at.tzinfo is not None
+    def test_timestamps_are_utc(self, default_draft):
+        assert default_draft.created_at.tzinfo is not None
+        assert default_draft.updated_at.tzinfo is not None
 
     def test_serialization_roundtrip(self, sample_post):
         data = sample_post.model_dump()
-        restored = PostDraft(**data)
+        restored = PostDraft.model_validate(data)
         assert restored.id == sample_post.id
         assert restored.content == sample_post.content
         assert restored.platform == sample_post.platform
@@ -189,7 +183,7 @@ class TestPipelineRun:
 
     def test_serialization_roundtrip(self, sample_pipeline_run):
         data = sample_pipeline_run.model_dump()
-        restored = PipelineRun(**data)
+        restored = PipelineRun.model_validate(data)
         assert restored.week_of == sample_pipeline_run.week_of
         assert restored.status == sample_pipeline_run.status
 
@@ -202,110 +196,21 @@ class TestWeeklyQueue:
         assert queue.pending_count() == 0
         assert queue.approved_count() == 0
 
-    def test_total_by_platform(self):
-        posts = [
-            PostDraft(
-                brief_id="b1",
-                stream=ContentStream.project_marketing,
-                platform=Platform.twitter,
-                content="tweet",
-            ),
-            PostDraft(
-                brief_id="b2",
-                stream=ContentStream.project_marketing,
-                platform=Platform.twitter,
-                content="tweet 2",
-            ),
-            PostDraft(
-                brief_id="b3",
-                stream=ContentStream.eve_content,
-                platform=Platform.linkedin,
-                content="post",
-            ),
-        ]
-        queue = WeeklyQueue(week_of=date(2025, 3, 3), posts=posts)
-        by_platform = queue.total_by_platform()
-        assert by_platform[Platform.twitter] == 2
-        assert by_platform[Platform.linkedin] == 1
-
-    def test_total_by_stream(self):
-        posts = [
-            PostDraft(
-                brief_id="b1",
-                stream=ContentStream.project_marketing,
-                platform=Platform.twitter,
-                content="tweet",
-            ),
-            PostDraft(
-                brief_id="b2",
-                stream=ContentStream.eve_content,
-                platform=Platform.reddit,
-                content="post",
-            ),
-            PostDraft(
-                brief_id="b3",
-                stream=ContentStream.eve_content,
-                platform=Platform.linkedin,
-                content="post 2",
-            ),
-        ]
-        queue = WeeklyQueue(week_of=date(2025, 3, 3), posts=posts)
-        by_stream = queue.total_by_stream()
-        assert by_stream[ContentStream.project_marketing] == 1
-        assert by_stream[ContentStream.eve_content] == 2
-
-    def test_pending_count(self):
+    def test_weekly_queue_aggregates(self):
         posts = [
-            PostDraft(
-                brief_id="b1",
-                stream=ContentStream.project_marketing,
-                platform=Platform.twitter,
-                content="t",
-                approval_status=ApprovalStatus.pending,
-            ),
-            PostDraft(
-                brief_id="b2",
-                stream=ContentStream.project_marketing,
-                platform=Platform.twitter,
-                content="t",
-                approval_status=ApprovalStatus.approved,
-            ),
-            PostDraft(
-                brief_id="b3",
-                stream=ContentStream.project_marketing,
-                platform=Platform.twitter,
-                content="t",
-                approval_status=ApprovalStatus.pending,
-            ),
-        ]
-        queue = WeeklyQueue(week_of=date(2025, 3, 3), posts=posts)
-        assert queue.pending_count() == 2
-
-    def test_approved_count_includes_edited(self):
-        posts = [
-            PostDraft(
-                brief_id="b1",
-                stream=ContentStream.project_marketing,
-                platform=Platform.twitter,
-                content="t",
-                approval_status=ApprovalStatus.approved,
-            ),
-            PostDraft(
-                brief_id="b2",
-                stream=ContentStream.project_marketing,
-                platform=Platform.twitter,
-                content="t",
-                approval_status=ApprovalStatus.edited,
-            ),
-            PostDraft(
-                brief_id="b3",
-                stream=ContentStream.project_marketing,
-                platform=Platform.twitter,
-                content="t",
-                approval_status=ApprovalStatus.rejected,
-            ),
+            _draft(Platform.twitter, ContentStream.project_marketing, ApprovalStatus.pending),
+            _draft(Platform.twitter, ContentStream.eve_content, ApprovalStatus.approved),
+            _draft(Platform.linkedin, ContentStream.eve_content, ApprovalStatus.edited),
+            _draft(Platform.linkedin, ContentStream.eve_content, ApprovalStatus.rejected),
         ]
         queue = WeeklyQueue(week_of=date(2025, 3, 3), posts=posts)
+        assert queue.total_by_platform() == {Platform.twitter: 2, Platform.linkedin: 2}
+        assert queue.total_by_stream() == {
+            ContentStream.project_marketing: 1,
+            ContentStream.eve_content: 3,
+        }
+        assert queue.pending_count() == 1
+        # edited counts as approved; rejected does not
         assert queue.approved_count() == 2
 
     def test_id_is_uuid(self):
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 from datetime import date
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
 
@@ -16,11 +17,13 @@ from marketing_engine.pipeline import ContentPipeline
 
 WEEK_OF = date(2025, 3, 3)
 
-CONFIG = {
-    "brand_voice": {},
-    "platform_rules": {},
-    "schedule_rules": {"timezone": "UTC"},
-}
+CONFIG = MappingProxyType(
+    {
+        "brand_voice": {},
+        "platform_rules": {},
+        "schedule_rules": {"timezone": "UTC"},
+    }
+)
 
 # ---------------------------------------------------------------------------
 # Mock responses — one per LLM call in order: research, draft, format (x N)
@@ -56,9 +59,33 @@ FORMAT_RESPONSE = json.dumps(
 )
 
 
+_RESPONSES = (RESEARCH_RESPONSE, DRAFT_RESPONSE, FORMAT_RESPONSE, FORMAT_RESPONSE)
+
+
 def _mock_llm() -> MockLLMClient:
     """Return a MockLLMClient cycling: research -> draft -> format -> format."""
-    return MockLLMClient([RESEARCH_RESPONSE, DRAFT_RESPONSE, FORMAT_RESPONSE, FORMAT_RESPONSE])
+    return MockLLMClient(list(_RESPONSES))
+
+
+@pytest.fixture(scope="class")
+def completed_run(class_db: Database) -> SimpleNamespace:
+    """Run the pipeline once per class and collect everything the tests inspect.
+
+    The DB is read once, right after the run, so tests assert against plain
+    values instead of each re-querying the same rows.
+    """
+    pipeline = ContentPipeline(db=class_db, llm=_mock_llm(), config=CONFIG)
+    result = pipeline.run(week_of=WEEK_OF)
+    conn = class_db._get_conn()
+    drafts = conn.execute("SELECT platform, scheduled_time FROM post_drafts").fetchall()
+    return SimpleNamespace(
+        result=result,
+        runs=class_db.get_pipeline_runs(),
+        brief_count=conn.execute("SELECT COUNT(*) FROM content_briefs").fetchone()[0],
+        draft_count=len(drafts),
+        platforms={row["platform"] for row in drafts},
+        scheduled_times=[row["scheduled_time"] for row in drafts],
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -67,81 +94,47 @@ def _mock_llm() -> MockLLMClient:
 
 
 class TestPipelineRun:
-    """Tests for a successful pipeline run."""
+    """Tests for a successful pipeline run.
 
-    def test_run_returns_completed_pipeline_run(self, tmp_db: Database) -> None:
-        llm = _mock_llm()
-        pipeline = ContentPipeline(db=tmp_db, llm=llm, config=CONFIG)
-        result = pipeline.run(week_of=WEEK_OF)
+    The pipeline runs once per class; every test only inspects its artefacts.
+    """
+
+    def test_run_returns_completed_pipeline_run(self, completed_run) -> None:
+        result = completed_run.result
         assert isinstance(result, PipelineRun)
         assert result.status == "completed"
 
-    def test_run_saves_pipeline_run_to_db(self, tmp_db: Database) -> None:
-        llm = _mock_llm()
-        pipeline = ContentPipeline(db=tmp_db, llm=llm, config=CONFIG)
-        pipeline.run(week_of=WEEK_OF)
-        runs = tmp_db.get_pipeline_runs()
+    def test_run_saves_pipeline_run_to_db(self, completed_run) -> None:
+        runs = completed_run.runs
         assert len(runs) == 1
         assert runs[0].status == "completed"
 
-    def test_run_saves_briefs_to_db(self, tmp_db: Database) -> None:
-        llm = _mock_llm()
-        pipeline = ContentPipeline(db=tmp_db, llm=llm, config=CONFIG)
-        result = pipeline.run(week_of=WEEK_OF)
+    def test_run_saves_briefs_to_db(self, completed_run) -> None:
         # Research returns 1 brief
-        assert result.briefs_count == 1
-        # Verify in DB — count briefs rows
-        conn = tmp_db._get_conn()
-        count = conn.execute("SELECT COUNT(*) FROM content_briefs").fetchone()[0]
-        assert count == 1
+        assert completed_run.result.briefs_count == 1
+        assert completed_run.brief_count == 1
 
-    def test_run_saves_drafts_to_db(self, tmp_db: Database) -> None:
-        llm = _mock_llm()
-        pipeline = ContentPipeline(db=tmp_db, llm=llm, config=CONFIG)
-        result = pipeline.run(week_of=WEEK_OF)
-        conn = tmp_db._get_conn()
-        count = conn.execute("SELECT COUNT(*) FROM post_drafts").fetchone()[0]
-        assert count == result.posts_count
+    def test_run_saves_drafts_to_db(self, completed_run) -> None:
+        assert completed_run.draft_count == completed_run.result.posts_count
 
-    def test_run_sets_briefs_count(self, tmp_db: Database) -> None:
-        llm = _mock_llm()
-        pipeline = ContentPipeline(db=tmp_db, llm=llm, config=CONFIG)
-        result = pipeline.run(week_of=WEEK_OF)
-        assert result.briefs_count == 1
+    def test_run_sets_briefs_count(self, completed_run) -> None:
+        assert completed_run.result.briefs_count == 1
 
-    def test_run_sets_drafts_count(self, tmp_db: Database) -> None:
-        llm = _mock_llm()
-        pipeline = ContentPipeline(db=tmp_db, llm=llm, config=CONFIG)
-        result = pipeline.run(week_of=WEEK_OF)
+    def test_run_sets_drafts_count(self, completed_run) -> None:
         # 1 brief with 2 platforms (twitter + linkedin) -> 2 drafts
-        assert result.drafts_count == 2
+        assert completed_run.result.drafts_count == 2
 
-    def test_run_sets_posts_count(self, tmp_db: Database) -> None:
-        llm = _mock_llm()
-        pipeline = ContentPipeline(db=tmp_db, llm=llm, config=CONFIG)
-        result = pipeline.run(week_of=WEEK_OF)
-        assert result.posts_count == 2
+    def test_run_sets_posts_count(self, completed_run) -> None:
+        assert completed_run.result.posts_count == 2
 
-    def test_run_creates_posts_per_platform(self, tmp_db: Database) -> None:
-        llm = _mock_llm()
-        pipeline = ContentPipeline(db=tmp_db, llm=llm, config=CONFIG)
-        pipeline.run(week_of=WEEK_OF)
+    def test_run_creates_posts_per_platform(self, completed_run) -> None:
         # Brief has platforms=["twitter", "linkedin"], so 2 posts
-        conn = tmp_db._get_conn()
-        platforms = {
-            row[0] for row in conn.execute("SELECT DISTINCT platform FROM post_drafts").fetchall()
-        }
-        assert "twitter" in platforms
-        assert "linkedin" in platforms
+        assert "twitter" in completed_run.platforms
+        assert "linkedin" in completed_run.platforms
 
-    def test_run_posts_have_scheduled_time(self, tmp_db: Database) -> None:
-        llm = _mock_llm()
-        pipeline = ContentPipeline(db=tmp_db, llm=llm, config=CONFIG)
-        pipeline.run(week_of=WEEK_OF)
-        conn = tmp_db._get_conn()
-        rows = conn.execute("SELECT scheduled_time FROM post_drafts").fetchall()
-        for row in rows:
-            assert row[0] is not None, "scheduled_time should be set by queue stage"
+    def test_run_posts_have_scheduled_time(self, completed_run) -> None:
+        for scheduled_time in completed_run.scheduled_times:
+            assert scheduled_time is not None, "scheduled_time should be set by queue stage"
 
 
 # ---------------------------------------------------------------------------
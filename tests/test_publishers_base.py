@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import importlib
 from unittest.mock import patch
 
 import pytest
@@ -31,6 +32,12 @@ def _make_post(
     )
 
 
+# Shared by tests that only read the post; build a fresh one when overriding fields.
+_DEFAULT_POST = _make_post()
+
+_PLATFORMS = tuple(Platform)
+
+
 # ---------------------------------------------------------------------------
 # PlatformPublisher ABC
 # ---------------------------------------------------------------------------
@@ -101,13 +108,12 @@ class TestDryRunPublisherInit:
 class TestDryRunPublisherPublish:
     def test_returns_publish_result(self):
         pub = DryRunPublisher()
-        post = _make_post()
-        result = pub.publish(post)
+        result = pub.publish(_DEFAULT_POST)
         assert isinstance(result, PublishResult)
 
     def test_result_is_success(self):
         pub = DryRunPublisher()
-        result = pub.publish(_make_post())
+        result = pub.publish(_DEFAULT_POST)
         assert result.success is True
 
     def test_result_uses_post_platform(self):
@@ -118,28 +124,27 @@ class TestDryRunPublisherPublish:
 
     def test_result_uses_post_id(self):
         pub = DryRunPublisher()
-        post = _make_post()
-        result = pub.publish(post)
-        assert result.post_id == post.id
+        result = pub.publish(_DEFAULT_POST)
+        assert result.post_id == _DEFAULT_POST.id
 
     def test_result_has_dry_run_id(self):
         pub = DryRunPublisher()
-        result = pub.publish(_make_post())
+        result = pub.publish(_DEFAULT_POST)
         assert result.platform_post_id == "dry-run-id"
 
     def test_result_has_dry_run_url(self):
         pub = DryRunPublisher()
-        result = pub.publish(_make_post())
+        result = pub.publish(_DEFAULT_POST)
         assert result.post_url == "https://example.com/dry-run"
 
     def test_result_has_published_at(self):
         pub = DryRunPublisher()
-        result = pub.publish(_make_post())
+        result = pub.publish(_DEFAULT_POST)
         assert result.published_at is not None
 
     def test_result_has_no_error(self):
         pub = DryRunPublisher()
-        result = pub.publish(_make_post())
+        result = pub.publish(_DEFAULT_POST)
         assert result.error is None
 
 
@@ -149,9 +154,8 @@ class TestDryRunPublisherValidateCredentials:
         assert pub.validate_credentials() is True
 
     def test_returns_true_for_all_platforms(self):
-        for plat in Platform:
-            pub = DryRunPublisher(platform=plat)
-            assert pub.validate_credentials() is True
+        for plat in _PLATFORMS:
+            assert DryRunPublisher(platform=plat).validate_credentials() is True
 
 
 # ---------------------------------------------------------------------------
@@ -180,37 +184,34 @@ class TestGetPublisherDryRun:
 
 
 class TestGetPublisherReal:
-    @patch("marketing_engine.publishers.twitter.get_platform_credentials", return_value={})
-    def test_twitter_returns_twitter_publisher(self, _mock_creds):
-        from marketing_engine.publishers.twitter import TwitterPublisher
-
-        pub = get_publisher(Platform.twitter, dry_run=False)
-        assert isinstance(pub, TwitterPublisher)
-
-    @patch("marketing_engine.publishers.linkedin.get_platform_credentials", return_value={})
-    def test_linkedin_returns_linkedin_publisher(self, _mock_creds):
-        from marketing_engine.publishers.linkedin import LinkedInPublisher
-
-        pub = get_publisher(Platform.linkedin, dry_run=False)
-        assert isinstance(pub, LinkedInPublisher)
+    @pytest.mark.parametrize(
+        ("platform", "module", "class_name"),
+        [
+            (Platform.twitter, "marketing_engine.publishers.twitter", "TwitterPublisher"),
+            (Platform.linkedin, "marketing_engine.publishers.linkedin", "LinkedInPublisher"),
+            (Platform.reddit, "marketing_engine.publishers.reddit", "RedditPublisher"),
+        ],
+        ids=["twitter", "linkedin", "reddit"],
+    )
+    def test_returns_platform_publisher(self, platform, module, class_name):
+        publisher_cls = getattr(importlib.import_module(module), class_name)
 
-    @patch("marketing_engine.publishers.reddit.get_platform_credentials", return_value={})
-    def test_reddit_returns_reddit_publisher(self, _mock_creds):
-        from marketing_engine.publishers.reddit import RedditPublisher
+        with patch(f"{module}.get_platform_credentials", return_value={}):
+            pub = get_publisher(platform, dry_run=False)
 
-        pub = get_publisher(Platform.reddit, dry_run=False)
-        assert isinstance(pub, RedditPublisher)
+        assert isinstance(pub, publisher_cls)
 
 
 class TestGetPublisherUnsupported:
-    def test_youtube_raises_publish_error(self):
-        with pytest.raises(PublishError, match="youtube"):
-            get_publisher(Platform.youtube, dry_run=False)
-
-    def test_tiktok_raises_publish_error(self):
-        with pytest.raises(PublishError, match="tiktok"):
-            get_publisher(Platform.tiktok, dry_run=False)
-
-    def test_error_message_mentions_supported_platforms(self):
-        with pytest.raises(PublishError, match="Supported"):
-            get_publisher(Platform.youtube, dry_run=False)
+    @pytest.mark.parametrize(
+        ("platform", "pattern"),
+        [
+            (Platform.youtube, "youtube"),
+            (Platform.tiktok, "tiktok"),
+            (Platform.youtube, "Supported"),
+        ],
+        ids=["youtube", "tiktok", "mentions-supported"],
+    )
+    def test_raises_publish_error(self, platform, pattern):
+        with pytest.raises(PublishError, match=pattern):
+            get_publisher(platform, dry_run=False)
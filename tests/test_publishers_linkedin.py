@@ -2,22 +2,24 @@
 
 from __future__ import annotations
 
+import functools
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
-import httpx
 import pytest
+from httpx import ConnectError, HTTPStatusError, Request, TimeoutException
 
 from marketing_engine.enums import ContentStream, Platform
 from marketing_engine.exceptions import PublishError
 from marketing_engine.models import PostDraft
+from marketing_engine.publishers import linkedin
 from marketing_engine.publishers.linkedin import LinkedInPublisher
 from marketing_engine.publishers.result import PublishResult
-
-_PATCH_CREDS = "marketing_engine.publishers.linkedin.get_platform_credentials"
-_PATCH_POST = "marketing_engine.publishers.linkedin.httpx.post"
+from tests.stubs import FakeResponse, publisher_with
 
 _VALID_CREDS = {"access_token": "li-token-abc", "person_id": "person-xyz"}
+_SCHEDULED = datetime(2025, 3, 4, 14, 0, tzinfo=UTC)
+_HASHTAGS = ("python", "cli")
 
 
 def _make_post(
@@ -30,20 +32,54 @@ def _make_post(
         stream=ContentStream.project_marketing,
         platform=Platform.linkedin,
         content=content,
-        hashtags=["python", "cli"],
+        hashtags=_HASHTAGS,
         cta_url="https://typer.tiangolo.com",
-        scheduled_time=datetime(2025, 3, 4, 14, 0, tzinfo=UTC),
+        scheduled_time=_SCHEDULED,
         edited_content=edited_content,
         **kwargs,
     )
 
 
-def _mock_success_response(post_urn: str = "urn:li:share:123456") -> MagicMock:
-    resp = MagicMock(spec=httpx.Response)
-    resp.status_code = 201
-    resp.headers = {"x-restli-id": post_urn}
-    resp.raise_for_status.return_value = None
-    return resp
+# Shared by tests that only read the post; build a fresh one when overriding fields.
+_DEFAULT_POST = _make_post()
+
+# UGC payload LinkedInPublisher should send for _DEFAULT_POST with _VALID_CREDS.
+_EXPECTED_PAYLOAD = {
+    "author": "urn:li:person:person-xyz",
+    "lifecycleState": "PUBLISHED",
+    "specificContent": {
+        "com.linkedin.ugc.ShareContent": {
+            "shareCommentary": {"text": "Build beautiful CLIs with Typer + Rich in Python."},
+            "shareMediaCategory": "NONE",
+        }
+    },
+    "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"},
+}
+
+
+# Responses are cached per argument set; tests only read them.
+@functools.cache
+def _mock_success_response(post_urn: str = "urn:li:share:123456") -> FakeResponse:
+    return FakeResponse(status_code=201, headers={"x-restli-id": post_urn})
+
+
+_UNAUTHORIZED_ERROR = HTTPStatusError(
+    "401 Unauthorized",
+    request=Request("POST", "https://api.linkedin.com/v2/ugcPosts"),
+    response=FakeResponse(status_code=401, text="Unauthorized"),
+)
+
+
+@pytest.fixture(scope="module")
+def li_pub() -> LinkedInPublisher:
+    """Return a LinkedInPublisher with valid credentials; it holds no other state."""
+    return publisher_with(LinkedInPublisher, _VALID_CREDS)
+
+
+@pytest.fixture(scope="module")
+def empty_li_pub() -> LinkedInPublisher:
+    """Return a LinkedInPublisher with no credentials."""
+    return publisher_with(LinkedInPublisher, {})
 
 
 # ---------------------------------------------------------------------------
@@ -52,20 +88,17 @@ def _mock_success_response(post_urn: str = "urn:li:share:123456") -> MagicMock:
 
 
 class TestLinkedInPublisherInit:
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_platform_is_linkedin(self, _mock_creds):
-        pub = LinkedInPublisher()
-        assert pub.platform == Platform.linkedin
+    def test_platform_is_linkedin(self, li_pub):
+        assert li_pub.platform == Platform.linkedin
 
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
+    @patch.object(linkedin, "get_platform_credentials", return_value=_VALID_CREDS)
     def test_calls_get_platform_credentials(self, mock_creds):
         LinkedInPublisher()
         mock_creds.assert_called_once_with("linkedin")
 
-    @patch(_PATCH_CREDS, return_value={})
+    @patch.object(linkedin, "get_platform_credentials", return_value={})
     def test_init_with_empty_creds(self, _mock_creds):
-        pub = LinkedInPublisher()
-        assert pub._creds == {}
+        assert LinkedInPublisher()._creds == {}
 
 
 # ---------------------------------------------------------------------------
@@ -74,35 +107,27 @@ class TestLinkedInPublisherInit:
 
 
 class TestLinkedInValidateCredentials:
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_valid_credentials(self, _mock_creds):
-        pub = LinkedInPublisher()
-        assert pub.validate_credentials() is True
-
-    @patch(_PATCH_CREDS, return_value={})
-    def test_missing_all_credentials(self, _mock_creds):
-        pub = LinkedInPublisher()
-        assert pub.validate_credentials() is False
-
-    @patch(_PATCH_CREDS, return_value={"access_token": "tok"})
-    def test_missing_person_id(self, _mock_creds):
-        pub = LinkedInPublisher()
-        assert pub.validate_credentials() is False
-
-    @patch(_PATCH_CREDS, return_value={"person_id": "pid"})
-    def test_missing_access_token(self, _mock_creds):
-        pub = LinkedInPublisher()
-        assert pub.validate_credentials() is False
-
-    @patch(_PATCH_CREDS, return_value={"access_token": "", "person_id": "pid"})
-    def test_empty_access_token(self, _mock_creds):
-        pub = LinkedInPublisher()
-        assert pub.validate_credentials() is False
-
-    @patch(_PATCH_CREDS, return_value={"access_token": "tok", "person_id": ""})
-    def test_empty_person_id(self, _mock_creds):
-        pub = LinkedInPublisher()
-        assert pub.validate_credentials() is False
+    @pytest.mark.parametrize(
+        ("creds", "expected"),
+        [
+            (_VALID_CREDS, True),
+            ({}, False),
+            ({"access_token": "tok"}, False),
+            ({"person_id": "pid"}, False),
+            ({"access_token": "", "person_id": "pid"}, False),
+            ({"access_token": "tok", "person_id": ""}, False),
+        ],
+        ids=[
+            "valid",
+            "missing-all",
+            "missing-person-id",
+            "missing-access-token",
+            "empty-access-token",
+            "empty-person-id",
+        ],
+    )
+    def test_validate_credentials(self, creds, expected):
+        assert publisher_with(LinkedInPublisher, creds).validate_credentials() is expected
 
 
 # ---------------------------------------------------------------------------
@@ -111,93 +136,48 @@ class TestLinkedInValidateCredentials:
 
 
 class TestLinkedInPublishSuccess:
-    @patch(_PATCH_POST, return_value=_mock_success_response())
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_returns_publish_result(self, _mock_creds, _mock_post):
-        pub = LinkedInPublisher()
-        result = pub.publish(_make_post())
+    def test_returns_publish_result(self, mock_post, li_pub):
+        mock_post.return_value = _mock_success_response()
+        result = li_pub.publish(_DEFAULT_POST)
         assert isinstance(result, PublishResult)
 
-    @patch(_PATCH_POST, return_value=_mock_success_response())
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_success_flag(self, _mock_creds, _mock_post):
-        pub = LinkedInPublisher()
-        result = pub.publish(_make_post())
+    def test_success_flag(self, mock_post, li_pub):
+        mock_post.return_value = _mock_success_response()
+        result = li_pub.publish(_DEFAULT_POST)
         assert result.success is True
 
-    @patch(_PATCH_POST, return_value=_mock_success_response("urn:li:share:999"))
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_post_urn_extracted(self, _mock_creds, _mock_post):
-        pub = LinkedInPublisher()
-        result = pub.publish(_make_post())
+    def test_post_urn_extracted(self, mock_post, li_pub):
+        mock_post.return_value = _mock_success_response("urn:li:share:999")
+        result = li_pub.publish(_DEFAULT_POST)
         assert result.platform_post_id == "urn:li:share:999"
 
-    @patch(_PATCH_POST, return_value=_mock_success_response("urn:li:share:999"))
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_post_url_format(self, _mock_creds, _mock_post):
-        pub = LinkedInPublisher()
-        result = pub.publish(_make_post())
+    def test_post_url_format(self, mock_post, li_pub):
+        mock_post.return_value = _mock_success_response("urn:li:share:999")
+        result = li_pub.publish(_DEFAULT_POST)
         assert result.post_url == "https://www.linkedin.com/feed/update/urn:li:share:999"
 
-    @patch(_PATCH_POST, return_value=_mock_success_response())
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_published_at_set(self, _mock_creds, _mock_post):
-        pub = LinkedInPublisher()
-        result = pub.publish(_make_post())
+    def test_published_at_set(self, mock_post, li_pub):
+        mock_post.return_value = _mock_success_response()
+        result = li_pub.publish(_DEFAULT_POST)
         assert result.published_at is not None
 
-    @patch(_PATCH_POST, return_value=_mock_success_response())
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_post_id_matches(self, _mock_creds, _mock_post):
-        pub = LinkedInPublisher()
-        post = _make_post()
-        result = pub.publish(post)
-        assert result.post_id == post.id
-
-    @patch(_PATCH_POST)
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_sends_bearer_header(self, _mock_creds, mock_post):
+    def test_post_id_matches(self, mock_post, li_pub):
         mock_post.return_value = _mock_success_response()
-        pub = LinkedInPublisher()
-        pub.publish(_make_post())
-        headers = mock_post.call_args.kwargs["headers"]
-        assert headers["Authorization"] == "Bearer li-token-abc"
-
-    @patch(_PATCH_POST)
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_sends_restli_protocol_header(self, _mock_creds, mock_post):
-        mock_post.return_value = _mock_success_response()
-        pub = LinkedInPublisher()
-        pub.publish(_make_post())
-        headers = mock_post.call_args.kwargs["headers"]
-        assert headers["X-Restli-Protocol-Version"] == "2.0.0"
-
-    @patch(_PATCH_POST)
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_ugc_payload_author(self, _mock_creds, mock_post):
-        mock_post.return_value = _mock_success_response()
-        pub = LinkedInPublisher()
-        pub.publish(_make_post())
-        payload = mock_post.call_args.kwargs["json"]
-        assert payload["author"] == "urn:li:person:person-xyz"
+        result = li_pub.publish(_DEFAULT_POST)
+        assert result.post_id == _DEFAULT_POST.id
 
-    @patch(_PATCH_POST)
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_ugc_payload_content(self, _mock_creds, mock_post):
+    def test_request_shape(self, mock_post, li_pub):
         mock_post.return_value = _mock_success_response()
-        pub = LinkedInPublisher()
-        pub.publish(_make_post(content="My LinkedIn post"))
-        payload = mock_post.call_args.kwargs["json"]
-        share = payload["specificContent"]["com.linkedin.ugc.ShareContent"]
-        assert share["shareCommentary"]["text"] == "My LinkedIn post"
+        li_pub.publish(_DEFAULT_POST)
+        kwargs = mock_post.call_args.kwargs
+        assert kwargs["headers"]["Authorization"] == "Bearer li-token-abc"
+        assert kwargs["headers"]["X-Restli-Protocol-Version"] == "2.0.0"
+        assert kwargs["json"] == _EXPECTED_PAYLOAD
 
-    @patch(_PATCH_POST)
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_uses_edited_content_when_available(self, _mock_creds, mock_post):
+    def test_uses_edited_content_when_available(self, mock_post, li_pub):
         mock_post.return_value = _mock_success_response()
-        pub = LinkedInPublisher()
         post = _make_post(content="original", edited_content="revised for LinkedIn")
-        pub.publish(post)
+        li_pub.publish(post)
         payload = mock_post.call_args.kwargs["json"]
         share = payload["specificContent"]["com.linkedin.ugc.ShareContent"]
         assert share["shareCommentary"]["text"] == "revised for LinkedIn"
@@ -209,30 +189,21 @@ class TestLinkedInPublishSuccess:
 
 
 class TestLinkedInPublishMissingCreds:
-    @patch(_PATCH_CREDS, return_value={})
-    def test_returns_failure(self, _mock_creds):
-        pub = LinkedInPublisher()
-        result = pub.publish(_make_post())
+    def test_returns_failure(self, empty_li_pub):
+        result = empty_li_pub.publish(_DEFAULT_POST)
         assert result.success is False
 
-    @patch(_PATCH_CREDS, return_value={})
-    def test_error_mentions_credentials(self, _mock_creds):
-        pub = LinkedInPublisher()
-        result = pub.publish(_make_post())
+    def test_error_mentions_credentials(self, empty_li_pub):
+        result = empty_li_pub.publish(_DEFAULT_POST)
         assert "LINKEDIN" in result.error
 
-    @patch(_PATCH_CREDS, return_value={"access_token": "tok"})
-    def test_missing_person_id_returns_failure(self, _mock_creds):
-        pub = LinkedInPublisher()
-        result = pub.publish(_make_post())
+    def test_missing_person_id_returns_failure(self):
+        result = publisher_with(LinkedInPublisher, {"access_token": "tok"}).publish(_DEFAULT_POST)
         assert result.success is False
 
-    @patch(_PATCH_CREDS, return_value={})
-    def test_no_api_call_made(self, _mock_creds):
-        with patch(_PATCH_POST) as mock_post:
-            pub = LinkedInPublisher()
-            pub.publish(_make_post())
-            mock_post.assert_not_called()
+    def test_no_api_call_made(self, mock_post, empty_li_pub):
+        empty_li_pub.publish(_DEFAULT_POST)
+        mock_post.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -241,34 +212,20 @@ class TestLinkedInPublishMissingCreds:
 
 
 class TestLinkedInPublishHTTPErrors:
-    @patch(_PATCH_POST)
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_http_status_error_raises_publish_error(self, _mock_creds, mock_post):
-        resp = MagicMock(spec=httpx.Response)
-        resp.status_code = 401
-        resp.text = "Unauthorized"
-        mock_post.return_value.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "401 Unauthorized", request=MagicMock(), response=resp
-        )
-        pub = LinkedInPublisher()
+    def test_http_status_error_raises_publish_error(self, mock_post, li_pub):
+        mock_post.return_value.raise_for_status.side_effect = _UNAUTHORIZED_ERROR
         with pytest.raises(PublishError, match="LinkedIn API error"):
-            pub.publish(_make_post())
+            li_pub.publish(_DEFAULT_POST)
 
-    @patch(_PATCH_POST)
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_connection_error_raises_publish_error(self, _mock_creds, mock_post):
-        mock_post.side_effect = httpx.ConnectError("Connection refused")
-        pub = LinkedInPublisher()
+    def test_connection_error_raises_publish_error(self, mock_post, li_pub):
+        mock_post.side_effect = ConnectError("Connection refused")
         with pytest.raises(PublishError, match="LinkedIn request failed"):
-            pub.publish(_make_post())
+            li_pub.publish(_DEFAULT_POST)
 
-    @patch(_PATCH_POST)
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_timeout_error_raises_publish_error(self, _mock_creds, mock_post):
-        mock_post.side_effect = httpx.TimeoutException("Timed out")
-        pub = LinkedInPublisher()
+    def test_timeout_error_raises_publish_error(self, mock_post, li_pub):
+        mock_post.side_effect = TimeoutException("Timed out")
         with pytest.raises(PublishError, match="LinkedIn request failed"):
-            pub.publish(_make_post())
+            li_pub.publish(_DEFAULT_POST)
 
 
 # ---------------------------------------------------------------------------
@@ -277,22 +234,14 @@ class TestLinkedInPublishHTTPErrors:
 
 
 class TestLinkedInPublishEdgeCases:
-    @patch(_PATCH_POST)
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_missing_restli_id_header(self, _mock_creds, mock_post):
-        resp = MagicMock(spec=httpx.Response)
-        resp.headers = {}
-        resp.raise_for_status.return_value = None
-        mock_post.return_value = resp
-        pub = LinkedInPublisher()
-        result = pub.publish(_make_post())
+    def test_missing_restli_id_header(self, mock_post, li_pub):
+        mock_post.return_value = FakeResponse(status_code=201)
+        result = li_pub.publish(_DEFAULT_POST)
         assert result.success is True
         assert result.platform_post_id == ""
         assert result.post_url is None
 
-    @patch(_PATCH_POST, return_value=_mock_success_response())
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_platform_field_is_linkedin(self, _mock_creds, _mock_post):
-        pub = LinkedInPublisher()
-        result = pub.publish(_make_post())
+    def test_platform_field_is_linkedin(self, mock_post, li_pub):
+        mock_post.return_value = _mock_success_response()
+        result = li_pub.publish(_DEFAULT_POST)
         assert result.platform == Platform.linkedin
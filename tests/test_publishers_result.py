@@ -51,36 +51,27 @@ class TestPublishResultCreation:
         assert result.published_at is None
 
 
-class TestPublishResultDefaults:
-    def test_platform_post_id_defaults_none(self):
-        result = PublishResult(success=True, platform=Platform.twitter, post_id="p1")
-        assert result.platform_post_id is None
+@pytest.fixture(scope="module")
+def default_result() -> PublishResult:
+    """Return a PublishResult with only the required fields set; tests only read it."""
+    return PublishResult(success=True, platform=Platform.twitter, post_id="p1")
 
-    def test_post_url_defaults_none(self):
-        result = PublishResult(success=True, platform=Platform.twitter, post_id="p1")
-        assert result.post_url is None
 
-    def test_error_defaults_none(self):
-        result = PublishResult(success=True, platform=Platform.twitter, post_id="p1")
-        assert result.error is None
+class TestPublishResultDefaults:
+    @pytest.mark.parametrize("attr", ["platform_post_id", "post_url", "error", "published_at"])
+    def test_defaults_none(self, default_result, attr):
+        assert getattr(default_result, attr) is None
 
-    def test_published_at_defaults_none(self):
-        result = PublishResult(success=True, platform=Platform.twitter, post_id="p1")
-        assert result.published_at is None
 
+_REQUIRED = {"success": True, "platform": Platform.twitter, "post_id": "p1"}
 
-class TestPublishResultValidation:
-    def test_missing_success_raises(self):
-        with pytest.raises(ValidationError):
-            PublishResult(platform=Platform.twitter, post_id="p1")
-
-    def test_missing_platform_raises(self):
-        with pytest.raises(ValidationError):
-            PublishResult(success=True, post_id="p1")
 
-    def test_missing_post_id_raises(self):
+class TestPublishResultValidation:
+    @pytest.mark.parametrize("missing", list(_REQUIRED))
+    def test_missing_required_field_raises(self, missing):
+        kwargs = {k: v for k, v in _REQUIRED.items() if k != missing}
         with pytest.raises(ValidationError):
-            PublishResult(success=True, platform=Platform.twitter)
+            PublishResult(**kwargs)
 
     def test_invalid_platform_raises(self):
         with pytest.raises(ValidationError):
@@ -99,7 +90,7 @@ class TestPublishResultSerialization:
             published_at=now,
         )
         data = original.model_dump()
-        restored = PublishResult(**data)
+        restored = PublishResult.model_validate(data)
         assert restored.success == original.success
         assert restored.platform == original.platform
         assert restored.post_id == original.post_id
@@ -107,7 +98,9 @@ class TestPublishResultSerialization:
         assert restored.post_url == original.post_url
         assert restored.published_at == original.published_at
 
-    def test_all_platforms_accepted(self):
-        for plat in Platform:
-            result = PublishResult(success=True, platform=plat, post_id="p1")
-            assert result.platform == plat
+    @pytest.mark.parametrize("plat", list(Platform), ids=lambda p: p.value)
+    def test_all_platforms_accepted(self, plat):
+        result = PublishResult.model_validate(
+            {"success": True, "platform": plat.value, "post_id": "p1"}
+        )
+        assert result.platform is plat
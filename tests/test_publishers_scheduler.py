@@ -3,119 +3,140 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock
 
 import pytest
 
+from marketing_engine.db import Database
 from marketing_engine.enums import ApprovalStatus, ContentStream, Platform, PublishStatus
 from marketing_engine.exceptions import PublishError
 from marketing_engine.models import PostDraft
+from marketing_engine.publishers import scheduler
+from marketing_engine.publishers.base import PlatformPublisher
 from marketing_engine.publishers.result import PublishResult
 from marketing_engine.publishers.scheduler import publish_due_posts, publish_single
 
-
-def _make_post(
-    post_id: str = "post-1",
-    platform: Platform = Platform.twitter,
-    approval_status: ApprovalStatus = ApprovalStatus.approved,
-    publish_status: PublishStatus = PublishStatus.pending,
-    scheduled_time: datetime | None = None,
-) -> PostDraft:
-    return PostDraft(
-        id=post_id,
-        brief_id="brief-1",
-        stream=ContentStream.project_marketing,
-        platform=platform,
-        content="Test post content.",
-        approval_status=approval_status,
-        publish_status=publish_status,
-        scheduled_time=scheduled_time or datetime(2025, 3, 4, 14, 0, tzinfo=UTC),
-    )
+_SCHEDULED = datetime(2025, 3, 4, 14, 0, tzinfo=UTC)
+_PUBLISHED_AT = datetime(2025, 3, 4, 14, 5, tzinfo=UTC)
+_NOW = datetime(2025, 3, 4, 15, 0, tzinfo=UTC)
+
+# Trusted fixture data, so skip validation; tests only read the post.
+_PROTO = PostDraft.model_construct(
+    id="post-1",
+    brief_id="brief-1",
+    stream=ContentStream.project_marketing,
+    platform=Platform.twitter,
+    content="Test post content.",
+    approval_status=ApprovalStatus.approved,
+    publish_status=PublishStatus.pending,
+    scheduled_time=_SCHEDULED,
+)
+
+
+def _make_post(**overrides) -> PostDraft:
+    """Return the shared prototype post, or a copy with ``overrides`` applied."""
+    return _PROTO.model_copy(update=overrides) if overrides else _PROTO
+
+
+# Canned results; only platform and post_id vary, so copy per post.
+_SUCCESS_TMPL = PublishResult.model_construct(
+    success=True,
+    platform=Platform.twitter,
+    post_id="",
+    platform_post_id="plat-123",
+    post_url="https://example.com/post/123",
+    published_at=_PUBLISHED_AT,
+)
+_FAILURE_TMPL = PublishResult.model_construct(
+    success=False,
+    platform=Platform.twitter,
+    post_id="",
+    error="API error",
+)
 
 
 def _success_result(post: PostDraft) -> PublishResult:
-    return PublishResult(
-        success=True,
-        platform=post.platform,
-        post_id=post.id,
-        platform_post_id="plat-123",
-        post_url="https://example.com/post/123",
-        published_at=datetime(2025, 3, 4, 14, 5, tzinfo=UTC),
-    )
+    return _SUCCESS_TMPL.model_copy(update={"platform": post.platform, "post_id": post.id})
 
 
 def _failure_result(post: PostDraft, error: str = "API error") -> PublishResult:
-    return PublishResult(
-        success=False,
-        platform=post.platform,
-        post_id=post.id,
-        error=error,
+    return _FAILURE_TMPL.model_copy(
+        update={"platform": post.platform, "post_id": post.id, "error": error}
     )
 
 
+@pytest.fixture()
+def db() -> Mock:
+    """Return a Database mock; spec'd so misspelt method calls fail."""
+    return Mock(spec=Database)
+
+
+@pytest.fixture()
+def mock_pub() -> Mock:
+    """Return a publisher mock for get_publisher to hand out."""
+    return Mock(spec=PlatformPublisher)
+
+
+@pytest.fixture()
+def mock_get_pub(monkeypatch, mock_pub) -> Mock:
+    """Replace the scheduler's get_publisher with a mock returning ``mock_pub``."""
+    mock = Mock(return_value=mock_pub)
+    monkeypatch.setattr(scheduler, "get_publisher", mock)
+    return mock
+
+
 # ---------------------------------------------------------------------------
 # publish_due_posts
 # ---------------------------------------------------------------------------
 
 
 class TestPublishDuePostsEmpty:
-    def test_no_publishable_returns_empty(self):
-        db = MagicMock()
+    @pytest.fixture()
+    def empty_db(self, db) -> Mock:
+        """Return the Database mock with nothing publishable."""
         db.get_publishable.return_value = []
+        return db
 
-        results = publish_due_posts(db, dry_run=True)
+    def test_no_publishable_returns_empty(self, empty_db):
+        assert publish_due_posts(empty_db, dry_run=True) == []
 
-        assert results == []
+    def test_calls_get_publishable_with_now(self, empty_db):
+        now = _SCHEDULED
 
-    def test_calls_get_publishable_with_now(self):
-        db = MagicMock()
-        db.get_publishable.return_value = []
-        now = datetime(2025, 3, 4, 14, 0, tzinfo=UTC)
-
-        publish_due_posts(db, now=now)
+        publish_due_posts(empty_db, now=now)
 
-        db.get_publishable.assert_called_once_with(now)
+        empty_db.get_publishable.assert_called_once_with(now)
 
-    def test_uses_utcnow_when_now_is_none(self):
-        db = MagicMock()
-        db.get_publishable.return_value = []
+    def test_uses_utcnow_when_now_is_none(self, empty_db):
+        publish_due_posts(empty_db)
 
-        publish_due_posts(db)
-
-        args = db.get_publishable.call_args[0]
+        args = empty_db.get_publishable.call_args[0]
         assert args[0].tzinfo is not None  # has timezone
 
 
+@pytest.mark.usefixtures("mock_get_pub")
 class TestPublishDuePostsSuccess:
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_publishes_each_post(self, mock_get_pub):
-        post1 = _make_post(post_id="p1")
-        post2 = _make_post(post_id="p2", platform=Platform.linkedin)
+    def test_publishes_each_post(self, db, mock_pub):
+        post1 = _make_post(id="p1")
+        post2 = _make_post(id="p2", platform=Platform.linkedin)
 
-        mock_pub = MagicMock()
         mock_pub.publish.side_effect = [_success_result(post1), _success_result(post2)]
-        mock_get_pub.return_value = mock_pub
 
-        db = MagicMock()
         db.get_publishable.return_value = [post1, post2]
 
-        results = publish_due_posts(db, dry_run=True, now=datetime(2025, 3, 4, 15, 0, tzinfo=UTC))
+        results = publish_due_posts(db, dry_run=True, now=_NOW)
 
         assert len(results) == 2
         assert all(r.success for r in results)
 
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_updates_db_status_on_success(self, mock_get_pub):
+    def test_updates_db_status_on_success(self, db, mock_pub):
         post = _make_post()
         result = _success_result(post)
-        mock_pub = MagicMock()
         mock_pub.publish.return_value = result
-        mock_get_pub.return_value = mock_pub
 
-        db = MagicMock()
         db.get_publishable.return_value = [post]
 
-        publish_due_posts(db, now=datetime(2025, 3, 4, 15, 0, tzinfo=UTC))
+        publish_due_posts(db, now=_NOW)
 
         db.update_publish_status.assert_called_once_with(
             post.id,
@@ -125,64 +146,49 @@ class TestPublishDuePostsSuccess:
             platform_post_id=result.platform_post_id,
         )
 
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_saves_publish_log_on_success(self, mock_get_pub):
+    def test_saves_publish_log_on_success(self, db, mock_pub):
         post = _make_post()
         result = _success_result(post)
-        mock_pub = MagicMock()
         mock_pub.publish.return_value = result
-        mock_get_pub.return_value = mock_pub
 
-        db = MagicMock()
         db.get_publishable.return_value = [post]
 
-        publish_due_posts(db, now=datetime(2025, 3, 4, 15, 0, tzinfo=UTC))
+        publish_due_posts(db, now=_NOW)
 
         db.save_publish_log.assert_called_once_with(result)
 
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_passes_dry_run_to_get_publisher(self, mock_get_pub):
+    def test_passes_dry_run_to_get_publisher(self, mock_get_pub, db, mock_pub):
         post = _make_post()
-        mock_pub = MagicMock()
         mock_pub.publish.return_value = _success_result(post)
-        mock_get_pub.return_value = mock_pub
 
-        db = MagicMock()
         db.get_publishable.return_value = [post]
 
-        publish_due_posts(db, dry_run=True, now=datetime(2025, 3, 4, 15, 0, tzinfo=UTC))
+        publish_due_posts(db, dry_run=True, now=_NOW)
 
         mock_get_pub.assert_called_once_with(post.platform, dry_run=True)
 
 
+@pytest.mark.usefixtures("mock_get_pub")
 class TestPublishDuePostsFailure:
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_publish_error_creates_failure_result(self, mock_get_pub):
+    def test_publish_error_creates_failure_result(self, db, mock_pub):
         post = _make_post()
-        mock_pub = MagicMock()
         mock_pub.publish.side_effect = PublishError("Twitter API down")
-        mock_get_pub.return_value = mock_pub
 
-        db = MagicMock()
         db.get_publishable.return_value = [post]
 
-        results = publish_due_posts(db, now=datetime(2025, 3, 4, 15, 0, tzinfo=UTC))
+        results = publish_due_posts(db, now=_NOW)
 
         assert len(results) == 1
         assert results[0].success is False
         assert "Twitter API down" in results[0].error
 
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_updates_db_with_failed_status(self, mock_get_pub):
+    def test_updates_db_with_failed_status(self, db, mock_pub):
         post = _make_post()
-        mock_pub = MagicMock()
         mock_pub.publish.side_effect = PublishError("rate limit")
-        mock_get_pub.return_value = mock_pub
 
-        db = MagicMock()
         db.get_publishable.return_value = [post]
 
-        publish_due_posts(db, now=datetime(2025, 3, 4, 15, 0, tzinfo=UTC))
+        publish_due_posts(db, now=_NOW)
 
         db.update_publish_status.assert_called_once_with(
             post.id,
@@ -190,77 +196,62 @@ class TestPublishDuePostsFailure:
             publish_error="rate limit",
         )
 
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_saves_publish_log_on_failure(self, mock_get_pub):
+    def test_saves_publish_log_on_failure(self, db, mock_pub):
         post = _make_post()
-        mock_pub = MagicMock()
         mock_pub.publish.side_effect = PublishError("error")
-        mock_get_pub.return_value = mock_pub
 
-        db = MagicMock()
         db.get_publishable.return_value = [post]
 
-        publish_due_posts(db, now=datetime(2025, 3, 4, 15, 0, tzinfo=UTC))
+        publish_due_posts(db, now=_NOW)
 
         db.save_publish_log.assert_called_once()
         logged = db.save_publish_log.call_args[0][0]
         assert logged.success is False
 
 
+@pytest.mark.usefixtures("mock_get_pub")
 class TestPublishDuePostsMixed:
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_mixed_success_and_failure(self, mock_get_pub):
-        post1 = _make_post(post_id="ok-1")
-        post2 = _make_post(post_id="fail-1")
+    def test_mixed_success_and_failure(self, db, mock_pub):
+        post1 = _make_post(id="ok-1")
+        post2 = _make_post(id="fail-1")
 
-        mock_pub = MagicMock()
         mock_pub.publish.side_effect = [
             _success_result(post1),
             PublishError("API error"),
         ]
-        mock_get_pub.return_value = mock_pub
 
-        db = MagicMock()
         db.get_publishable.return_value = [post1, post2]
 
-        results = publish_due_posts(db, now=datetime(2025, 3, 4, 15, 0, tzinfo=UTC))
+        results = publish_due_posts(db, now=_NOW)
 
         assert len(results) == 2
         assert results[0].success is True
         assert results[1].success is False
 
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_continues_after_failure(self, mock_get_pub):
-        post1 = _make_post(post_id="fail-first")
-        post2 = _make_post(post_id="ok-second")
+    def test_continues_after_failure(self, db, mock_pub):
+        post1 = _make_post(id="fail-first")
+        post2 = _make_post(id="ok-second")
 
-        mock_pub = MagicMock()
         mock_pub.publish.side_effect = [
             PublishError("first fails"),
             _success_result(post2),
         ]
-        mock_get_pub.return_value = mock_pub
 
-        db = MagicMock()
         db.get_publishable.return_value = [post1, post2]
 
-        results = publish_due_posts(db, now=datetime(2025, 3, 4, 15, 0, tzinfo=UTC))
+        results = publish_due_posts(db, now=_NOW)
 
         assert len(results) == 2
         assert db.update_publish_status.call_count == 2
         assert db.save_publish_log.call_count == 2
 
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_result_platform_matches_post(self, mock_get_pub):
+    def test_result_platform_matches_post(self, db, mock_pub):
         post = _make_post(platform=Platform.reddit)
-        mock_pub = MagicMock()
         mock_pub.publish.side_effect = PublishError("fail")
-        mock_get_pub.return_value = mock_pub
 
-        db = MagicMock()
         db.get_publishable.return_value = [post]
 
-        results = publish_due_posts(db, now=datetime(2025, 3, 4, 15, 0, tzinfo=UTC))
+        results = publish_due_posts(db, now=_NOW)
 
         assert results[0].platform == Platform.reddit
 
@@ -271,15 +262,13 @@ class TestPublishDuePostsMixed:
 
 
 class TestPublishSingleNotFound:
-    def test_raises_publish_error_when_post_not_found(self):
-        db = MagicMock()
+    def test_raises_publish_error_when_post_not_found(self, db):
         db.get_post.return_value = None
 
         with pytest.raises(PublishError, match="Post not found"):
             publish_single(db, "nonexistent-id")
 
-    def test_error_includes_post_id(self):
-        db = MagicMock()
+    def test_error_includes_post_id(self, db):
         db.get_post.return_value = None
 
         with pytest.raises(PublishError, match="abc-123"):
@@ -287,75 +276,49 @@ class TestPublishSingleNotFound:
 
 
 class TestPublishSingleNotApproved:
-    def test_pending_post_raises(self):
+    def test_pending_post_raises(self, db):
         post = _make_post(approval_status=ApprovalStatus.pending)
-        db = MagicMock()
         db.get_post.return_value = post
 
         with pytest.raises(PublishError, match="not approved"):
             publish_single(db, post.id)
 
-    def test_rejected_post_raises(self):
+    def test_rejected_post_raises(self, db):
         post = _make_post(approval_status=ApprovalStatus.rejected)
-        db = MagicMock()
         db.get_post.return_value = post
 
         with pytest.raises(PublishError, match="not approved"):
             publish_single(db, post.id)
 
-    def test_error_includes_current_status(self):
+    def test_error_includes_current_status(self, db):
         post = _make_post(approval_status=ApprovalStatus.rejected)
-        db = MagicMock()
         db.get_post.return_value = post
 
         with pytest.raises(PublishError, match="rejected"):
             publish_single(db, post.id)
 
 
+@pytest.mark.usefixtures("mock_get_pub")
 class TestPublishSingleApproved:
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_approved_post_succeeds(self, mock_get_pub):
-        post = _make_post(approval_status=ApprovalStatus.approved)
-        result = _success_result(post)
-        mock_pub = MagicMock()
-        mock_pub.publish.return_value = result
-        mock_get_pub.return_value = mock_pub
-
-        db = MagicMock()
-        db.get_post.return_value = post
-
-        ret = publish_single(db, post.id)
-
-        assert ret.success is True
-
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_edited_post_succeeds(self, mock_get_pub):
-        post = _make_post(approval_status=ApprovalStatus.edited)
-        result = _success_result(post)
-        mock_pub = MagicMock()
-        mock_pub.publish.return_value = result
-        mock_get_pub.return_value = mock_pub
+    @pytest.mark.parametrize("status", [ApprovalStatus.approved, ApprovalStatus.edited])
+    def test_publishable_status_succeeds(self, db, mock_pub, status):
+        post = _make_post(approval_status=status)
+        mock_pub.publish.return_value = _success_result(post)
 
-        db = MagicMock()
         db.get_post.return_value = post
 
-        ret = publish_single(db, post.id)
+        assert publish_single(db, post.id).success is True
 
-        assert ret.success is True
-
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_updates_db_status_on_success(self, mock_get_pub):
+    def test_success_side_effects(self, mock_get_pub, db, mock_pub):
         post = _make_post()
         result = _success_result(post)
-        mock_pub = MagicMock()
         mock_pub.publish.return_value = result
-        mock_get_pub.return_value = mock_pub
 
-        db = MagicMock()
         db.get_post.return_value = post
 
-        publish_single(db, post.id)
+        publish_single(db, post.id, dry_run=True)
 
+        mock_get_pub.assert_called_once_with(post.platform, dry_run=True)
         db.update_publish_status.assert_called_once_with(
             post.id,
             PublishStatus.published,
@@ -363,46 +326,15 @@ class TestPublishSingleApproved:
             post_url=result.post_url,
             platform_post_id=result.platform_post_id,
         )
-
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_saves_publish_log(self, mock_get_pub):
-        post = _make_post()
-        result = _success_result(post)
-        mock_pub = MagicMock()
-        mock_pub.publish.return_value = result
-        mock_get_pub.return_value = mock_pub
-
-        db = MagicMock()
-        db.get_post.return_value = post
-
-        publish_single(db, post.id)
-
         db.save_publish_log.assert_called_once_with(result)
 
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_passes_dry_run_flag(self, mock_get_pub):
-        post = _make_post()
-        mock_pub = MagicMock()
-        mock_pub.publish.return_value = _success_result(post)
-        mock_get_pub.return_value = mock_pub
-
-        db = MagicMock()
-        db.get_post.return_value = post
-
-        publish_single(db, post.id, dry_run=True)
-
-        mock_get_pub.assert_called_once_with(post.platform, dry_run=True)
-
 
+@pytest.mark.usefixtures("mock_get_pub")
 class TestPublishSingleFailure:
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_publish_error_returns_failure_result(self, mock_get_pub):
+    def test_publish_error_returns_failure_result(self, db, mock_pub):
         post = _make_post()
-        mock_pub = MagicMock()
         mock_pub.publish.side_effect = PublishError("network timeout")
-        mock_get_pub.return_value = mock_pub
 
-        db = MagicMock()
         db.get_post.return_value = post
 
         result = publish_single(db, post.id)
@@ -410,14 +342,10 @@ class TestPublishSingleFailure:
         assert result.success is False
         assert "network timeout" in result.error
 
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_updates_db_with_failed_status(self, mock_get_pub):
+    def test_updates_db_with_failed_status(self, db, mock_pub):
         post = _make_post()
-        mock_pub = MagicMock()
         mock_pub.publish.side_effect = PublishError("bad request")
-        mock_get_pub.return_value = mock_pub
 
-        db = MagicMock()
         db.get_post.return_value = post
 
         publish_single(db, post.id)
@@ -428,14 +356,10 @@ class TestPublishSingleFailure:
             publish_error="bad request",
         )
 
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_saves_publish_log_on_failure(self, mock_get_pub):
+    def test_saves_publish_log_on_failure(self, db, mock_pub):
         post = _make_post()
-        mock_pub = MagicMock()
         mock_pub.publish.side_effect = PublishError("fail")
-        mock_get_pub.return_value = mock_pub
 
-        db = MagicMock()
         db.get_post.return_value = post
 
         publish_single(db, post.id)
@@ -444,28 +368,20 @@ class TestPublishSingleFailure:
         logged = db.save_publish_log.call_args[0][0]
         assert logged.success is False
 
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_failure_result_has_post_id(self, mock_get_pub):
-        post = _make_post(post_id="my-post")
-        mock_pub = MagicMock()
+    def test_failure_result_has_post_id(self, db, mock_pub):
+        post = _make_post(id="my-post")
         mock_pub.publish.side_effect = PublishError("fail")
-        mock_get_pub.return_value = mock_pub
 
-        db = MagicMock()
         db.get_post.return_value = post
 
         result = publish_single(db, post.id)
 
         assert result.post_id == "my-post"
 
-    @patch("marketing_engine.publishers.scheduler.get_publisher")
-    def test_failure_result_has_platform(self, mock_get_pub):
+    def test_failure_result_has_platform(self, db, mock_pub):
         post = _make_post(platform=Platform.linkedin)
-        mock_pub = MagicMock()
         mock_pub.publish.side_effect = PublishError("fail")
-        mock_get_pub.return_value = mock_pub
 
-        db = MagicMock()
         db.get_post.return_value = post
 
         result = publish_single(db, post.id)
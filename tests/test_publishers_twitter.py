@@ -2,22 +2,29 @@
 
 from __future__ import annotations
 
+import functools
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from unittest.mock import patch
 
-import httpx
 import pytest
+from httpx import ConnectError, HTTPStatusError, Request, TimeoutException
 
 from marketing_engine.enums import ContentStream, Platform
 from marketing_engine.exceptions import PublishError
 from marketing_engine.models import PostDraft
+from marketing_engine.publishers import twitter
 from marketing_engine.publishers.result import PublishResult
 from marketing_engine.publishers.twitter import TwitterPublisher
+from tests.stubs import FakeResponse, publisher_with
 
-_PATCH_CREDS = "marketing_engine.publishers.twitter.get_platform_credentials"
-_PATCH_POST = "marketing_engine.publishers.twitter.httpx.post"
+# Read-only so a publisher or test can't mutate the creds other tests share.
+_VALID_CREDS = MappingProxyType({"bearer_token": "test-bearer-token-123"})
+_SCHEDULED = datetime(2025, 3, 4, 14, 0, tzinfo=UTC)
+_HASHTAGS = ("python", "cli")
 
-_VALID_CREDS = {"bearer_token": "test-bearer-token-123"}
+# Every test gets the patched httpx.post, so none can reach the real API.
+pytestmark = pytest.mark.usefixtures("mock_post")
 
 
 def _make_post(
@@ -30,20 +37,54 @@ def _make_post(
         stream=ContentStream.project_marketing,
         platform=Platform.twitter,
         content=content,
-        hashtags=["python", "cli"],
+        hashtags=_HASHTAGS,
         cta_url="https://typer.tiangolo.com",
-        scheduled_time=datetime(2025, 3, 4, 14, 0, tzinfo=UTC),
+        scheduled_time=_SCHEDULED,
         edited_content=edited_content,
         **kwargs,
     )
 
 
-def _mock_success_response(tweet_id: str = "1234567890") -> MagicMock:
-    resp = MagicMock(spec=httpx.Response)
-    resp.status_code = 201
-    resp.json.return_value = {"data": {"id": tweet_id}}
-    resp.raise_for_status.return_value = None
-    return resp
+# Shared by tests that only read the post; build a fresh one when overriding fields.
+_DEFAULT_POST = _make_post()
+
+
+_FORBIDDEN_ERROR = HTTPStatusError(
+    "403 Forbidden",
+    request=Request("POST", "https://api.twitter.com/2/tweets"),
+    response=FakeResponse(status_code=403, text="Forbidden"),
+)
+
+
+# Responses are cached per argument set; tests only read them.
+@functools.cache
+def _mock_success_response(tweet_id: str = "1234567890") -> FakeResponse:
+    return FakeResponse(status_code=201, json={"data": {"id": tweet_id}})
+
+
+@pytest.fixture()
+def captured(mock_post) -> list[dict]:
+    """Record the keyword arguments of each httpx.post call and answer with a 201 tweet."""
+    calls: list[dict] = []
+
+    def _post(*_args, **kwargs):
+        calls.append(kwargs)
+        return _mock_success_response()
+
+    mock_post.side_effect = _post
+    return calls
+
+
+@pytest.fixture(scope="module")
+def twitter_pub() -> TwitterPublisher:
+    """Return a TwitterPublisher with valid credentials; it holds no other state."""
+    return publisher_with(TwitterPublisher, _VALID_CREDS)
+
+
+@pytest.fixture(scope="module")
+def empty_twitter_pub() -> TwitterPublisher:
+    """Return a TwitterPublisher with no credentials."""
+    return publisher_with(TwitterPublisher, {})
 
 
 # ---------------------------------------------------------------------------
@@ -52,17 +93,15 @@ def _mock_success_response(tweet_id: str = "1234567890") -> MagicMock:
 
 
 class TestTwitterPublisherInit:
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_platform_is_twitter(self, _mock_creds):
-        pub = TwitterPublisher()
-        assert pub.platform == Platform.twitter
+    def test_platform_is_twitter(self, twitter_pub):
+        assert twitter_pub.platform == Platform.twitter
 
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
+    @patch.object(twitter, "get_platform_credentials", return_value=_VALID_CREDS)
     def test_calls_get_platform_credentials(self, mock_creds):
         TwitterPublisher()
         mock_creds.assert_called_once_with("twitter")
 
-    @patch(_PATCH_CREDS, return_value={})
+    @patch.object(twitter, "get_platform_credentials", return_value={})
     def test_init_with_empty_creds(self, _mock_creds):
         pub = TwitterPublisher()
         assert pub._creds == {}
@@ -74,25 +113,18 @@ class TestTwitterPublisherInit:
 
 
 class TestTwitterValidateCredentials:
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_valid_bearer_token(self, _mock_creds):
-        pub = TwitterPublisher()
-        assert pub.validate_credentials() is True
-
-    @patch(_PATCH_CREDS, return_value={})
-    def test_missing_bearer_token(self, _mock_creds):
-        pub = TwitterPublisher()
-        assert pub.validate_credentials() is False
-
-    @patch(_PATCH_CREDS, return_value={"bearer_token": ""})
-    def test_empty_bearer_token(self, _mock_creds):
-        pub = TwitterPublisher()
-        assert pub.validate_credentials() is False
-
-    @patch(_PATCH_CREDS, return_value={"bearer_token": None})
-    def test_none_bearer_token(self, _mock_creds):
-        pub = TwitterPublisher()
-        assert pub.validate_credentials() is False
+    @pytest.mark.parametrize(
+        ("creds", "expected"),
+        [
+            (_VALID_CREDS, True),
+            ({}, False),
+            ({"bearer_token": ""}, False),
+            ({"bearer_token": None}, False),
+        ],
+        ids=["valid", "missing", "empty", "none"],
+    )
+    def test_validate_credentials(self, creds, expected):
+        assert publisher_with(TwitterPublisher, creds).validate_credentials() is expected
 
 
 # ---------------------------------------------------------------------------
@@ -101,75 +133,30 @@ class TestTwitterValidateCredentials:
 
 
 class TestTwitterPublishSuccess:
-    @patch(_PATCH_POST, return_value=_mock_success_response())
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_returns_publish_result(self, _mock_creds, _mock_post):
-        pub = TwitterPublisher()
-        result = pub.publish(_make_post())
-        assert isinstance(result, PublishResult)
+    def test_publish_success_fields(self, mock_post, twitter_pub):
+        mock_post.return_value = _mock_success_response("9876543210")
 
-    @patch(_PATCH_POST, return_value=_mock_success_response("9876543210"))
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_success_flag(self, _mock_creds, _mock_post):
-        pub = TwitterPublisher()
-        result = pub.publish(_make_post())
-        assert result.success is True
+        result = twitter_pub.publish(_DEFAULT_POST)
 
-    @patch(_PATCH_POST, return_value=_mock_success_response("9876543210"))
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_tweet_id_extracted(self, _mock_creds, _mock_post):
-        pub = TwitterPublisher()
-        result = pub.publish(_make_post())
+        assert isinstance(result, PublishResult)
+        assert result.success is True
+        assert result.platform == Platform.twitter
+        assert result.post_id == _DEFAULT_POST.id
         assert result.platform_post_id == "9876543210"
-
-    @patch(_PATCH_POST, return_value=_mock_success_response("9876543210"))
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_post_url_format(self, _mock_creds, _mock_post):
-        pub = TwitterPublisher()
-        result = pub.publish(_make_post())
         assert result.post_url == "https://twitter.com/i/status/9876543210"
-
-    @patch(_PATCH_POST, return_value=_mock_success_response("111"))
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_published_at_set(self, _mock_creds, _mock_post):
-        pub = TwitterPublisher()
-        result = pub.publish(_make_post())
         assert result.published_at is not None
 
-    @patch(_PATCH_POST, return_value=_mock_success_response("111"))
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_post_id_matches(self, _mock_creds, _mock_post):
-        pub = TwitterPublisher()
-        post = _make_post()
-        result = pub.publish(post)
-        assert result.post_id == post.id
-
-    @patch(_PATCH_POST)
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_sends_correct_payload(self, _mock_creds, mock_post):
-        mock_post.return_value = _mock_success_response()
-        pub = TwitterPublisher()
-        pub.publish(_make_post(content="Hello world"))
-        call_kwargs = mock_post.call_args
-        assert call_kwargs.kwargs["json"] == {"text": "Hello world"}
-
-    @patch(_PATCH_POST)
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_sends_bearer_header(self, _mock_creds, mock_post):
-        mock_post.return_value = _mock_success_response()
-        pub = TwitterPublisher()
-        pub.publish(_make_post())
-        headers = mock_post.call_args.kwargs["headers"]
-        assert headers["Authorization"] == "Bearer test-bearer-token-123"
-
-    @patch(_PATCH_POST)
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_uses_edited_content_when_available(self, _mock_creds, mock_post):
-        mock_post.return_value = _mock_success_response()
-        pub = TwitterPublisher()
-        post = _make_post(content="original", edited_content="revised tweet")
-        pub.publish(post)
-        assert mock_post.call_args.kwargs["json"]["text"] == "revised tweet"
+    def test_sends_correct_payload(self, captured, twitter_pub):
+        twitter_pub.publish(_make_post(content="Hello world"))
+        assert captured[0]["json"] == {"text": "Hello world"}
+
+    def test_sends_bearer_header(self, captured, twitter_pub):
+        twitter_pub.publish(_DEFAULT_POST)
+        assert captured[0]["headers"]["Authorization"] == "Bearer test-bearer-token-123"
+
+    def test_uses_edited_content_when_available(self, captured, twitter_pub):
+        twitter_pub.publish(_make_post(content="original", edited_content="revised tweet"))
+        assert captured[0]["json"]["text"] == "revised tweet"
 
 
 # ---------------------------------------------------------------------------
@@ -178,24 +165,17 @@ class TestTwitterPublishSuccess:
 
 
 class TestTwitterPublishMissingCreds:
-    @patch(_PATCH_CREDS, return_value={})
-    def test_returns_failure(self, _mock_creds):
-        pub = TwitterPublisher()
-        result = pub.publish(_make_post())
+    def test_returns_failure(self, empty_twitter_pub):
+        result = empty_twitter_pub.publish(_DEFAULT_POST)
         assert result.success is False
 
-    @patch(_PATCH_CREDS, return_value={})
-    def test_error_mentions_bearer_token(self, _mock_creds):
-        pub = TwitterPublisher()
-        result = pub.publish(_make_post())
+    def test_error_mentions_bearer_token(self, empty_twitter_pub):
+        result = empty_twitter_pub.publish(_DEFAULT_POST)
         assert "BEARER_TOKEN" in result.error
 
-    @patch(_PATCH_CREDS, return_value={})
-    def test_no_api_call_made(self, _mock_creds):
-        with patch(_PATCH_POST) as mock_post:
-            pub = TwitterPublisher()
-            pub.publish(_make_post())
-            mock_post.assert_not_called()
+    def test_no_api_call_made(self, mock_post, empty_twitter_pub):
+        empty_twitter_pub.publish(_DEFAULT_POST)
+        mock_post.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -204,34 +184,23 @@ class TestTwitterPublishMissingCreds:
 
 
 class TestTwitterPublishHTTPErrors:
-    @patch(_PATCH_POST)
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_http_status_error_raises_publish_error(self, _mock_creds, mock_post):
-        resp = MagicMock(spec=httpx.Response)
-        resp.status_code = 403
-        resp.text = "Forbidden"
-        mock_post.return_value.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "403 Forbidden", request=MagicMock(), response=resp
-        )
-        pub = TwitterPublisher()
-        with pytest.raises(PublishError, match="Twitter API error"):
-            pub.publish(_make_post())
-
-    @patch(_PATCH_POST)
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_connection_error_raises_publish_error(self, _mock_creds, mock_post):
-        mock_post.side_effect = httpx.ConnectError("Connection refused")
-        pub = TwitterPublisher()
-        with pytest.raises(PublishError, match="Twitter request failed"):
-            pub.publish(_make_post())
-
-    @patch(_PATCH_POST)
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_timeout_error_raises_publish_error(self, _mock_creds, mock_post):
-        mock_post.side_effect = httpx.TimeoutException("Timed out")
-        pub = TwitterPublisher()
-        with pytest.raises(PublishError, match="Twitter request failed"):
-            pub.publish(_make_post())
+    @pytest.mark.parametrize(
+        ("exc", "match"),
+        [
+            (_FORBIDDEN_ERROR, "Twitter API error"),
+            (ConnectError("Connection refused"), "Twitter request failed"),
+            (TimeoutException("Timed out"), "Twitter request failed"),
+        ],
+        ids=["http-status", "connect", "timeout"],
+    )
+    def test_raises_publish_error(self, mock_post, twitter_pub, exc, match):
+        # Status errors come from raise_for_status(); transport errors from the post itself.
+        if isinstance(exc, HTTPStatusError):
+            mock_post.return_value.raise_for_status.side_effect = exc
+        else:
+            mock_post.side_effect = exc
+        with pytest.raises(PublishError, match=match):
+            twitter_pub.publish(_DEFAULT_POST)
 
 
 # ---------------------------------------------------------------------------
@@ -240,34 +209,14 @@ class TestTwitterPublishHTTPErrors:
 
 
 class TestTwitterPublishEdgeCases:
-    @patch(_PATCH_POST)
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_empty_data_in_response(self, _mock_creds, mock_post):
-        resp = MagicMock(spec=httpx.Response)
-        resp.json.return_value = {"data": {}}
-        resp.raise_for_status.return_value = None
-        mock_post.return_value = resp
-        pub = TwitterPublisher()
-        result = pub.publish(_make_post())
+    @pytest.mark.parametrize(
+        "body",
+        [{"data": {}}, {}],
+        ids=["empty-data", "missing-data-key"],
+    )
+    def test_response_without_tweet_id(self, mock_post, twitter_pub, body):
+        mock_post.return_value = FakeResponse(status_code=201, json=body)
+        result = twitter_pub.publish(_DEFAULT_POST)
         assert result.success is True
         assert result.platform_post_id == ""
         assert result.post_url is None
-
-    @patch(_PATCH_POST)
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_missing_data_key_in_response(self, _mock_creds, mock_post):
-        resp = MagicMock(spec=httpx.Response)
-        resp.json.return_value = {}
-        resp.raise_for_status.return_value = None
-        mock_post.return_value = resp
-        pub = TwitterPublisher()
-        result = pub.publish(_make_post())
-        assert result.success is True
-        assert result.platform_post_id == ""
-
-    @patch(_PATCH_POST, return_value=_mock_success_response("42"))
-    @patch(_PATCH_CREDS, return_value=_VALID_CREDS)
-    def test_platform_field_is_twitter(self, _mock_creds, _mock_post):
-        pub = TwitterPublisher()
-        result = pub.publish(_make_post())
-        assert result.platform == Platform.twitter